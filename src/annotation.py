@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import cv2 as cv
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+
+class LabelAtlas:
+    """
+    An LRU cache of rendered text labels keyed by (text, font size).
+
+    Each label is rasterized once with PIL into an alpha mask, so drawing the same OCR text
+    on later frames is a plain numpy blend. The (left, top) offset of the glyphs is kept
+    with the mask so labels land exactly where `ImageDraw.text` would have drawn them.
+    """
+    def __init__(self, font_path: str, max_entries: int = 256):
+        self.font_path = font_path
+        self.max_entries = max_entries
+        self._fonts: Dict[int, ImageFont.ImageFont] = {}
+        self._labels: "OrderedDict[Tuple[str, int], Tuple[np.ndarray, int, int]]" = OrderedDict()
+
+    def _font(self, font_size: int) -> ImageFont.ImageFont:
+        font = self._fonts.get(font_size)
+        if font is None:
+            try:
+                font = ImageFont.truetype(self.font_path, font_size)
+            except IOError:
+                print(f"Could not load font from {self.font_path}, falling back to default font.")
+                font = ImageFont.load_default()
+            self._fonts[font_size] = font
+        return font
+
+    def get(self, text: str, font_size: int) -> Tuple[np.ndarray, int, int]:
+        """Returns (alpha mask as float32 HxWx1, left offset, top offset) for a label."""
+        key = (text, font_size)
+        entry = self._labels.get(key)
+        if entry is not None:
+            self._labels.move_to_end(key)
+            return entry
+
+        font = self._font(font_size)
+        left, top, right, bottom = font.getbbox(text)
+        mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+        alpha = (np.asarray(mask, dtype=np.float32) / 255.0)[:, :, None]
+
+        entry = (alpha, left, top)
+        self._labels[key] = entry
+        if len(self._labels) > self.max_entries:
+            self._labels.popitem(last=False)
+        return entry
+
+
+class AnnotationRenderer:
+    """Draws OCR boxes and labels directly into a BGR frame."""
+
+    def __init__(
+        self,
+        font_path: str,
+        font_size: int = 32,
+        text_color: Tuple[int, int, int] = (0, 0, 255),
+        box_color: Tuple[int, int, int] = (0, 255, 0),
+        box_thickness: int = 2,
+        max_cached_labels: int = 256,
+    ):
+        self.font_size = font_size
+        self.text_color = np.array(text_color, dtype=np.float32)
+        self.box_color = box_color
+        self.box_thickness = box_thickness
+        self.atlas = LabelAtlas(font_path, max_entries=max_cached_labels)
+
+    def draw(self, frame: np.ndarray, result: list, copy: bool = True) -> np.ndarray:
+        """
+        Returns the frame with every (bbox, text, prob) of the result drawn on it.
+        With copy=False the frame is annotated in place.
+        """
+        annotated = frame.copy() if copy else frame
+        for (bbox, text, prob) in result:
+            top_left = tuple(map(int, bbox[0]))
+            bottom_right = tuple(map(int, bbox[2]))
+            cv.rectangle(annotated, top_left, bottom_right, self.box_color, self.box_thickness)
+            label_pos = (top_left[0], max(0, top_left[1] - self.font_size - 5))
+            self._blend_label(annotated, text, label_pos)
+        return annotated
+
+    def _blend_label(self, frame: np.ndarray, text: str, pos: Tuple[int, int]):
+        alpha, left, top = self.atlas.get(text, self.font_size)
+        x0, y0 = pos[0] + left, pos[1] + top
+        h, w = frame.shape[:2]
+
+        # Clip the label to the frame.
+        ax0, ay0 = max(0, -x0), max(0, -y0)
+        x0, y0 = max(0, x0), max(0, y0)
+        x1 = min(w, x0 + alpha.shape[1] - ax0)
+        y1 = min(h, y0 + alpha.shape[0] - ay0)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        a = alpha[ay0:ay0 + (y1 - y0), ax0:ax0 + (x1 - x0)]
+        roi = frame[y0:y1, x0:x1]
+        roi[...] = (roi + (self.text_color - roi) * a).astype(np.uint8)
@@ -1,14 +1,93 @@
-import requests
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from dur_cache import DURCache
+from perf import perf
+
+if TYPE_CHECKING:
+    import requests
+
+    from dur_index import DURIndex
+
+
+def extract_items(response_data: dict) -> List[dict]:
+    """Safely extracts the list of items from a DUR API response."""
+    try:
+        items = response_data.get("body", {}).get("items", [])
+        if isinstance(items, dict):  # API can return a dict for a single item
+            items = items.get("item", [])
+        if isinstance(items, dict):  # or a dict with a single item
+            return [items]
+        return items or []
+    except (AttributeError, TypeError):
+        return []
+
+
+def total_count(response_data: dict) -> int:
+    """Returns the total number of matching items reported by a DUR API response."""
+    try:
+        return int(response_data.get("body", {}).get("totalCount", 0) or 0)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
 
 class DURClient:
     """A client for the DUR (Drug Utilization Review) API."""
     BASE_URL = "https://apis.data.go.kr/1471000/DURPrdlstInfoService03/getUsjntTabooInfoList03"
 
-    def __init__(self, api_key: str, timeout: float = 10.0):
-        if not api_key:
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 10.0,
+        cache: Optional[DURCache] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: int = 4,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        offline_index: Optional["DURIndex"] = None,
+    ):
+        if not api_key and offline_index is None:
             raise ValueError("API key (DECODING_KEY) is missing. Please check your config.yaml.")
         self.api_key = api_key
         self.timeout = timeout
+        self.cache = cache
+        self.base_url = base_url or self.BASE_URL
+        self.offline_index = offline_index
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+
+        self._session = None
+        self._session_lock = threading.Lock()
+        # Lookups coordinate pages, so they get their own pool to never starve the page requests.
+        self._lookup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dur-lookup")
+        self._page_executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="dur-page")
+
+    def _get_session(self) -> "requests.Session":
+        """Returns a keep-alive session with a connection pool and retry with backoff."""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=self.retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=("GET",),
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency, max_retries=retry)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
 
     def query_drug_interaction(
         self,
@@ -17,7 +96,7 @@ class DURClient:
         rows: int = 3,
         type_name: str = "병용금기",  # Contraindication
         output_format: str = "json",
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """Queries for contraindications for a given drug item."""
         params = {
             "serviceKey": self.api_key,
@@ -27,6 +106,124 @@ class DURClient:
             "itemName": item_name,
             "type": output_format,
         }
-        response = requests.get(self.BASE_URL, params=params, timeout=self.timeout)
+        with perf.stage("dur.http"):
+            response = self._get_session().get(self.base_url, params=params, timeout=self.timeout)
         response.raise_for_status()  # Raise an exception for bad status codes
         return response
+
+    def fetch_drug_interaction(
+        self,
+        item_name: str,
+        page_no: int = 1,
+        rows: int = 3,
+        type_name: str = "병용금기",  # Contraindication
+    ) -> dict:
+        """
+        Returns the decoded JSON response for a contraindication query, using the cache if one is set.
+        Stale cache entries are returned immediately and refreshed in the background.
+        With an offline index, the network is only used for queries the index cannot answer;
+        without an API key, those queries return an empty response.
+        """
+        if self.offline_index is not None:
+            payload = self.offline_index.query(item_name, type_name, page_no, rows)
+            if payload is not None:
+                return payload
+            if not self.api_key:
+                return {"body": {"pageNo": page_no, "numOfRows": rows, "totalCount": 0, "items": []}}
+
+        if self.cache is None:
+            return self.query_drug_interaction(item_name, page_no, rows, type_name).json()
+
+        key = DURCache.make_key(item_name, type_name, page_no, rows)
+        payload, fresh = self.cache.get(key)
+        if payload is not None:
+            if not fresh:
+                self._revalidate(key, item_name, page_no, rows, type_name)
+            return payload
+        return self._fetch_and_store(key, item_name, page_no, rows, type_name)
+
+    def fetch_all_interactions(
+        self,
+        item_name: str,
+        rows: int = 100,
+        type_name: str = "병용금기",  # Contraindication
+        on_page: Optional[Callable[[int, List[dict]], None]] = None,
+    ) -> List[dict]:
+        """
+        Fetches every result page for an item and returns all items.
+        The first page reveals `totalCount`; the remaining pages are then requested in parallel.
+        `on_page(page_no, items)` is called as each page arrives, in completion order.
+        """
+        started = time.perf_counter()
+        first = self.fetch_drug_interaction(item_name, page_no=1, rows=rows, type_name=type_name)
+        items = list(extract_items(first))
+        if on_page is not None:
+            on_page(1, items)
+
+        page_count = math.ceil(total_count(first) / rows) if rows > 0 else 1
+        futures = {
+            self._page_executor.submit(self.fetch_drug_interaction, item_name, page_no, rows, type_name): page_no
+            for page_no in range(2, page_count + 1)
+        }
+        pages = {}
+        for future in as_completed(futures):
+            page_no = futures[future]
+            page_items = extract_items(future.result())
+            pages[page_no] = page_items
+            if on_page is not None:
+                on_page(page_no, page_items)
+        for page_no in sorted(pages):
+            items.extend(pages[page_no])
+        perf.record("dur.lookup", (time.perf_counter() - started) * 1000.0)
+        return items
+
+    def fetch_all_interactions_async(
+        self,
+        item_name: str,
+        rows: int = 100,
+        type_name: str = "병용금기",  # Contraindication
+        on_page: Optional[Callable[[int, List[dict]], None]] = None,
+    ) -> Future:
+        """Runs `fetch_all_interactions` in the background and returns a future of all items."""
+        return self._lookup_executor.submit(self.fetch_all_interactions, item_name, rows, type_name, on_page)
+
+    def close(self):
+        """Cancels pending lookups and closes the pooled HTTP session."""
+        self._lookup_executor.shutdown(wait=False, cancel_futures=True)
+        self._page_executor.shutdown(wait=False, cancel_futures=True)
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _fetch_and_store(self, key: str, item_name: str, page_no: int, rows: int, type_name: str) -> dict:
+        payload = self.query_drug_interaction(item_name, page_no, rows, type_name).json()
+        if self._is_cacheable(payload):
+            self.cache.put(key, payload)
+        return payload
+
+    def _revalidate(self, key: str, item_name: str, page_no: int, rows: int, type_name: str):
+        """Refreshes a stale cache entry on a background thread, once per key at a time."""
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def refresh():
+            try:
+                self._fetch_and_store(key, item_name, page_no, rows, type_name)
+            except Exception as e:
+                print(f"Failed to refresh cached DUR response for {item_name}. Error: {e}")
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=refresh, name="dur-cache-refresh", daemon=True).start()
+
+    @staticmethod
+    def _is_cacheable(payload: dict) -> bool:
+        """Only successful responses are cached; the API reports errors in the header with HTTP 200."""
+        if not isinstance(payload, dict) or "body" not in payload:
+            return False
+        result_code = str(payload.get("header", {}).get("resultCode", "00"))
+        return result_code == "00"
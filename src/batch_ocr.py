@@ -0,0 +1,198 @@
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterator, List, Optional, Set, TextIO, Tuple
+
+import numpy as np
+
+from frame_source import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, ImageSequenceSource, VideoFileSource
+from ocr import OCRCamera, group_by_shape, readtext_batch, result_records
+
+# One OCR camera (and therefore one EasyOCR reader) per worker process.
+_camera = None
+
+
+def _init_worker(languages: List[str], gpu: bool):
+    global _camera
+    _camera = OCRCamera(
+        languages=languages, gpu=gpu, cam_index=None, background_load=False, skip_unchanged_frames=False
+    )
+    if _camera.reader is None:
+        raise RuntimeError(f"OCR reader is unavailable: {_camera.reader_error}")
+
+
+def _to_record(source: str, frame_index: Optional[int], result: list) -> dict:
+    records = result_records(result)
+    return {
+        "source": source,
+        "frame": frame_index,
+        "texts": [text for (_, text, _) in records],
+        "results": [{"box": box, "text": text, "confidence": prob} for (box, text, prob) in records],
+    }
+
+
+def _recognize_batch(items: List[Tuple[str, Optional[int], np.ndarray]]) -> List[dict]:
+    """Runs OCR over a batch, batching frames of the same size into one inference call."""
+    records = [None] * len(items)
+    for indices in group_by_shape([frame for (_, _, frame) in items]):
+        results = readtext_batch(_camera.reader, [items[i][2] for i in indices])
+        for i, result in zip(indices, results):
+            records[i] = _to_record(items[i][0], items[i][1], result)
+    return records
+
+
+def _process_images(paths: List[str]) -> List[dict]:
+    items, errors = [], []
+    source = ImageSequenceSource(paths)
+    for path in source.paths:
+        ok, frame = source.read()
+        if ok:
+            items.append((path, None, frame))
+        else:
+            errors.append({"source": path, "frame": None, "error": "Could not read image"})
+    return errors + (_recognize_batch(items) if items else [])
+
+
+def _report_error(source: str, message: str) -> List[dict]:
+    return [{"source": source, "frame": None, "error": message}]
+
+
+def _process_frames(items: List[Tuple[str, Optional[int], np.ndarray]]) -> List[dict]:
+    return _recognize_batch(items)
+
+
+def iter_video_batches(path: str, batch_size: int, frame_stride: int) -> Iterator[list]:
+    """
+    Decodes a video sequentially and yields batches of (path, frame index, frame).
+    Frame counts and seeking are unreliable for many containers and codecs, so the video is
+    read front to back exactly once.
+    """
+    source = VideoFileSource(path)
+    try:
+        batch = []
+        frame_index = 0
+        while True:
+            ok, frame = source.read()
+            if not ok:
+                break
+            if frame_index % frame_stride == 0:
+                batch.append((path, frame_index, frame))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            frame_index += 1
+        if batch:
+            yield batch
+    finally:
+        source.release()
+
+
+def expand_inputs(inputs: List[str]) -> Iterator[str]:
+    """Expands directories (recursively) and glob patterns into image and video file paths."""
+    for entry in inputs:
+        if os.path.isdir(entry):
+            for root, _, files in os.walk(entry):
+                for name in sorted(files):
+                    if name.lower().endswith(IMAGE_EXTENSIONS + VIDEO_EXTENSIONS):
+                        yield os.path.join(root, name)
+        elif glob.has_magic(entry):
+            yield from sorted(glob.iglob(entry, recursive=True))
+        else:
+            yield entry
+
+
+def iter_tasks(paths: Iterator[str], batch_size: int, frame_stride: int) -> Iterator[tuple]:
+    """
+    Groups images into batches and decodes videos in this process into batches of frames,
+    one task per batch. Tasks are generated lazily, so only the batches in flight are in memory.
+    """
+    images = []
+    for path in paths:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in VIDEO_EXTENSIONS:
+            try:
+                for batch in iter_video_batches(path, batch_size, frame_stride):
+                    yield _process_frames, (batch,)
+            except RuntimeError as e:
+                yield _report_error, (path, str(e))
+        elif extension in IMAGE_EXTENSIONS:
+            images.append(path)
+            if len(images) >= batch_size:
+                yield _process_images, (images,)
+                images = []
+    if images:
+        yield _process_images, (images,)
+
+
+def run_batch(
+    inputs: List[str],
+    output: TextIO,
+    workers: int = 2,
+    batch_size: int = 8,
+    frame_stride: int = 1,
+    languages: Optional[List[str]] = None,
+    gpu: bool = False,
+) -> int:
+    """
+    Runs OCR over all inputs on a process pool and streams one JSON line per image/frame.
+    At most two batches per worker are in flight, so memory stays flat on large inputs.
+    Returns the number of records written.
+    """
+    languages = languages or ["ko", "en"]
+    written = 0
+    pending: Set[Future] = set()
+    tasks = iter_tasks(expand_inputs(inputs), batch_size, frame_stride)
+
+    def drain(return_when):
+        nonlocal written, pending
+        done, pending = wait(pending, return_when=return_when)
+        for future in done:
+            for record in future.result():
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                written += 1
+        output.flush()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(languages, gpu)) as pool:
+        for func, args in tasks:
+            pending.add(pool.submit(func, *args))
+            if len(pending) >= workers * 2:
+                drain(FIRST_COMPLETED)
+        while pending:
+            drain(FIRST_COMPLETED)
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run OCR over image directories, globs and video files.")
+    parser.add_argument("inputs", nargs="+", help="Image files, directories, glob patterns or video files.")
+    parser.add_argument("-o", "--output", help="JSONL output file (default: stdout).")
+    parser.add_argument("-w", "--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("-b", "--batch-size", type=int, default=8, help="Images/frames per inference batch.")
+    parser.add_argument("--frame-stride", type=int, default=1, help="Process every n-th video frame.")
+    parser.add_argument("--languages", nargs="+", default=["ko", "en"])
+    parser.add_argument("--gpu", action="store_true", help="Use the GPU in every worker.")
+    args = parser.parse_args(argv)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        written = run_batch(
+            args.inputs,
+            output,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            frame_stride=max(1, args.frame_stride),
+            languages=args.languages,
+            gpu=args.gpu,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"Wrote {written} records.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+import argparse
+import difflib
+import json
+import platform
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from cpu_backend import BACKENDS
+from frame_source import FrameSource, ImageSequenceSource, PacedSource, SyntheticLabelSource, VideoFileSource
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+
+def summarize(samples_ms: List[float]) -> dict:
+    """Returns latency percentiles (in milliseconds) of a list of samples."""
+    if not samples_ms:
+        return {"count": 0}
+    values = np.asarray(samples_ms, dtype=np.float64)
+    return {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p90": float(np.percentile(values, 90)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+def peak_memory_mb() -> Optional[float]:
+    """Returns the peak resident set size of this process in MiB, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def text_accuracy(pairs: List[tuple]) -> dict:
+    """
+    Scores recognized texts against ground truth: the exact-match rate and the mean character
+    similarity of each frame's joined texts (spaces ignored).
+    """
+    if not pairs:
+        return {"frames": 0}
+    exact = 0
+    similarity = 0.0
+    for truth, texts in pairs:
+        truth = truth.replace(" ", "")
+        recognized = "".join(texts).replace(" ", "")
+        exact += recognized == truth
+        similarity += difflib.SequenceMatcher(None, truth, recognized).ratio()
+    return {"frames": len(pairs), "exact": exact / len(pairs), "similarity": similarity / len(pairs)}
+
+
+def make_source(args, live: bool = False) -> FrameSource:
+    """Builds the corpus source. Live sources loop and are paced like a camera."""
+    if args.video:
+        return VideoFileSource(args.video, loop=live, realtime=live)
+    if args.images:
+        source = ImageSequenceSource(args.images, loop=live)
+    else:
+        source = SyntheticLabelSource(num_frames=None if live else args.frames, seed=args.seed)
+    return PacedSource(source, fps=args.fps) if live else source
+
+
+def camera_kwargs(args) -> dict:
+    return {
+        "languages": args.languages,
+        "gpu": args.gpu,
+        "skip_unchanged_frames": args.skip_unchanged,
+        "ocr_mode": args.ocr_mode,
+        "detection_scale": args.detection_scale,
+        "backend": args.backend,
+        "cpu_threads": args.cpu_threads,
+    }
+
+
+def run_camera_benchmark(args) -> dict:
+    """Replays the corpus through UIOCRCamera and times each stage of every frame."""
+    from ocr import UIOCRCamera
+
+    source = make_source(args)
+    camera = UIOCRCamera(cam_index=None, source=source, background_load=False, **camera_kwargs(args))
+    if camera.reader is None:
+        raise RuntimeError(f"OCR reader is unavailable: {camera.reader_error}")
+
+    stages: Dict[str, List[float]] = {"read": [], "recognize": [], "annotate": [], "total": []}
+    # Synthetic frames carry their ground truth, which lets backends be compared for accuracy.
+    ground_truth: List[tuple] = []
+    started = time.perf_counter()
+    for _ in range(args.frames):
+        t0 = time.perf_counter()
+        ok, frame = source.read()
+        if not ok:
+            break
+        t1 = time.perf_counter()
+        result = camera.recognize(frame)
+        t2 = time.perf_counter()
+        if isinstance(source, SyntheticLabelSource):
+            ground_truth.append((source.current_text, camera.texts_from_result(result)))
+        camera.annotate(frame, result)
+        t3 = time.perf_counter()
+        stages["read"].append((t1 - t0) * 1000.0)
+        stages["recognize"].append((t2 - t1) * 1000.0)
+        stages["annotate"].append((t3 - t2) * 1000.0)
+        stages["total"].append((t3 - t0) * 1000.0)
+    elapsed = time.perf_counter() - started
+    source.release()
+
+    frames = len(stages["total"])
+    results = {
+        "stages": {name: summarize(samples) for name, samples in stages.items()},
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "inference": camera.inference_stats(),
+    }
+    if ground_truth:
+        results["accuracy"] = text_accuracy(ground_truth)
+    return results
+
+
+def run_worker_benchmark(args) -> dict:
+    """
+    Runs OCRWorker on a paced, looping corpus for `--duration` seconds after the model is
+    ready and measures the interval between displayed frames and the pipeline counters.
+    """
+    from PySide6.QtCore import QCoreApplication, QTimer
+    from main import OCRWorker
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    worker = OCRWorker(
+        target_ocr_fps=args.target_ocr_fps, source=make_source(args, live=True), camera_options=camera_kwargs(args)
+    )
+    intervals: List[float] = []
+    state = {"last": None, "measuring": False, "started": 0.0, "frames": 0}
+
+    def on_frame_ready():
+        if worker.take_frame() is None or not state["measuring"]:
+            return
+        now = time.perf_counter()
+        if state["last"] is not None:
+            intervals.append((now - state["last"]) * 1000.0)
+        state["last"] = now
+        state["frames"] += 1
+
+    def on_ocr_ready():
+        state["measuring"] = True
+        state["started"] = time.perf_counter()
+        QTimer.singleShot(int(args.duration * 1000), app.quit)
+
+    worker.frame_ready.connect(on_frame_ready)
+    worker.ocr_ready.connect(on_ocr_ready)
+    worker.error.connect(lambda message: (print(f"Worker error: {message}", file=sys.stderr), app.quit()))
+    worker.start()
+    app.exec()
+    elapsed = time.perf_counter() - state["started"] if state["measuring"] else 0.0
+    worker.stop()
+
+    return {
+        "stages": {"display_interval": summarize(intervals)},
+        "fps": state["frames"] / elapsed if elapsed > 0 else 0.0,
+        "pipeline": worker.pipeline_stats(),
+    }
+
+
+def compare(baseline: dict, current: dict, tolerance: float, accuracy_tolerance: float = 0.02) -> List[str]:
+    """Returns human-readable regressions of `current` against `baseline`."""
+    regressions = []
+    for stage, stats in baseline.get("stages", {}).items():
+        now = current.get("stages", {}).get(stage, {})
+        for key in ("p50", "p90"):
+            if key in stats and key in now and now[key] > stats[key] * (1.0 + tolerance):
+                regressions.append(f"{stage} {key}: {stats[key]:.2f} ms -> {now[key]:.2f} ms")
+    if baseline.get("fps") and current.get("fps", 0.0) < baseline["fps"] * (1.0 - tolerance):
+        regressions.append(f"fps: {baseline['fps']:.2f} -> {current['fps']:.2f}")
+    for key in ("exact", "similarity"):
+        before = baseline.get("accuracy", {}).get(key)
+        now = current.get("accuracy", {}).get(key)
+        if before is not None and now is not None and now < before - accuracy_tolerance:
+            regressions.append(f"accuracy {key}: {before:.3f} -> {now:.3f}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Reproducible OCR pipeline benchmark.")
+    parser.add_argument("--target", choices=("camera", "worker"), default="camera",
+                        help="Benchmark UIOCRCamera stage by stage, or the full OCRWorker pipeline.")
+    corpus = parser.add_mutually_exclusive_group()
+    corpus.add_argument("--images", help="Directory or glob of images to replay.")
+    corpus.add_argument("--video", help="Video file to replay.")
+    parser.add_argument("--frames", type=int, default=100, help="Frames to process (camera target).")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds to measure (worker target).")
+    parser.add_argument("--fps", type=float, default=30.0, help="Pacing of live sources (worker target).")
+    parser.add_argument("--target-ocr-fps", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic corpus.")
+    parser.add_argument("--languages", nargs="+", default=["ko", "en"])
+    parser.add_argument("--gpu", action="store_true")
+    parser.add_argument("--skip-unchanged", action="store_true", help="Enable scene-change gating.")
+    parser.add_argument("--ocr-mode", choices=("full", "tracking"), default="full")
+    parser.add_argument("--detection-scale", type=float, default=1.0)
+    parser.add_argument("--backend", choices=BACKENDS, default="default",
+                        help="Inference backend; compare a CPU backend against a 'default' baseline.")
+    parser.add_argument("--cpu-threads", type=int, help="Intra-op threads of the CPU backends.")
+    parser.add_argument("-o", "--output", help="Write the results as JSON (e.g. a new baseline).")
+    parser.add_argument("--baseline", help="Compare against a saved baseline and fail on regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression.")
+    parser.add_argument("--accuracy-tolerance", type=float, default=0.02,
+                        help="Allowed absolute drop of the accuracy scores.")
+    args = parser.parse_args(argv)
+
+    if args.target == "camera":
+        results = run_camera_benchmark(args)
+    else:
+        results = run_worker_benchmark(args)
+    results["peak_memory_mb"] = peak_memory_mb()
+    results["config"] = {key: value for key, value in vars(args).items() if key not in ("output", "baseline")}
+    results["platform"] = {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()}
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(json.load(f), results, args.tolerance, args.accuracy_tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
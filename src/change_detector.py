@@ -0,0 +1,57 @@
+from typing import Optional, Tuple
+
+import cv2 as cv
+import numpy as np
+
+
+class SceneChangeDetector:
+    """
+    A cheap scene-change detector based on a downscaled grayscale frame difference.
+
+    Each frame is shrunk to a small thumbnail and compared against the thumbnail of the
+    last frame that was actually sent to OCR. The scene counts as changed when either the
+    mean absolute difference or the fraction of noticeably changed pixels exceeds its
+    threshold. Because the reference is only replaced when a frame is processed, slow
+    drift accumulates until it eventually triggers a new OCR pass.
+    """
+    def __init__(
+        self,
+        mean_threshold: float = 6.0,
+        area_threshold: float = 0.02,
+        pixel_threshold: int = 25,
+        size: Tuple[int, int] = (64, 48),
+    ):
+        self.mean_threshold = mean_threshold
+        self.area_threshold = area_threshold
+        self.pixel_threshold = pixel_threshold
+        self.size = size
+        self._reference: Optional[np.ndarray] = None
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        if frame.ndim == 3:
+            frame = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        thumb = cv.resize(frame, self.size, interpolation=cv.INTER_AREA)
+        return cv.GaussianBlur(thumb, (3, 3), 0)
+
+    def difference(self, frame: np.ndarray) -> Tuple[float, float]:
+        """
+        Returns (mean absolute difference, changed pixel fraction) against the reference.
+        Both values are infinite when there is no reference yet.
+        """
+        if self._reference is None:
+            return float("inf"), float("inf")
+        diff = cv.absdiff(self._thumbnail(frame), self._reference)
+        return float(diff.mean()), float(np.count_nonzero(diff > self.pixel_threshold)) / diff.size
+
+    def has_changed(self, frame: np.ndarray) -> bool:
+        """Checks whether the frame differs materially from the reference frame."""
+        mean_diff, changed_area = self.difference(frame)
+        return mean_diff > self.mean_threshold or changed_area > self.area_threshold
+
+    def update_reference(self, frame: np.ndarray):
+        """Makes the given frame the new reference for later comparisons."""
+        self._reference = self._thumbnail(frame)
+
+    def reset(self):
+        """Forgets the reference so that the next frame always counts as changed."""
+        self._reference = None
@@ -0,0 +1,107 @@
+import os
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    import easyocr
+
+BACKENDS = ("default", "cpu", "cpu-onnx")
+
+
+def default_cpu_threads() -> int:
+    """Returns the number of inference threads to use, leaving one core for capture and the UI."""
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def configure_cpu_threads(num_threads: Optional[int] = None) -> int:
+    """
+    Limits torch (and OpenMP, if torch has not been imported yet) to `num_threads` intra-op
+    threads and a single inter-op thread. The limits are process-wide.
+    """
+    num_threads = num_threads or default_cpu_threads()
+    os.environ.setdefault("OMP_NUM_THREADS", str(num_threads))
+    os.environ.setdefault("MKL_NUM_THREADS", str(num_threads))
+
+    import torch
+
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Can only be set once, before any inter-op parallel work has started.
+    return num_threads
+
+
+class _OnnxDetector:
+    """
+    Runs the CRAFT text detector through ONNX Runtime.
+    Called like the torch module it replaces: takes a batch tensor and returns (y, feature).
+    """
+    def __init__(self, model_path: str, num_threads: int):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = num_threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __call__(self, x):
+        import torch
+
+        y, feature = self.session.run(None, {self.input_name: x.cpu().numpy()})
+        return torch.from_numpy(y), torch.from_numpy(feature)
+
+    def eval(self):
+        return self
+
+
+def export_detector(reader: "easyocr.Reader", path: str):
+    """Exports the reader's CRAFT detector to ONNX with dynamic batch and image sizes."""
+    import torch
+
+    dummy = torch.zeros(1, 3, 640, 640)
+    with torch.no_grad():
+        torch.onnx.export(
+            reader.detector, dummy, path,
+            input_names=["image"], output_names=["y", "feature"],
+            dynamic_axes={
+                "image": {0: "batch", 2: "height", 3: "width"},
+                "y": {0: "batch", 1: "map_height", 2: "map_width"},
+                "feature": {0: "batch", 2: "map_height", 3: "map_width"},
+            },
+            opset_version=13,
+        )
+
+
+def create_cpu_reader(
+    languages: List[str], backend: str = "cpu", num_threads: Optional[int] = None
+) -> "easyocr.Reader":
+    """
+    Creates an EasyOCR reader tuned for CPU-only machines.
+
+    "cpu" differs from the stock CPU reader only in its explicit thread limits; EasyOCR already
+    quantizes the recognition model to int8 on CPU by default. "cpu-onnx" additionally runs the
+    detector through ONNX Runtime; the exported model is cached next to the EasyOCR weights.
+    Without onnxruntime it falls back to the torch detector.
+    """
+    if backend not in BACKENDS or backend == "default":
+        raise ValueError(f"Unknown CPU backend: {backend}")
+    num_threads = configure_cpu_threads(num_threads)
+
+    import easyocr
+
+    reader = easyocr.Reader(languages, gpu=False, quantize=True)
+    if backend == "cpu-onnx":
+        try:
+            import onnxruntime  # noqa: F401
+        except ImportError:
+            print("onnxruntime is not installed, running the detector with torch.")
+            return reader
+        path = os.path.join(reader.model_storage_directory, "craft_detector.onnx")
+        if not os.path.exists(path):
+            export_detector(reader, path)
+        reader.detector = _OnnxDetector(path, num_threads)
+    return reader
@@ -0,0 +1,47 @@
+from typing import Optional
+
+
+class AdaptiveScaleController:
+    """
+    Picks the text-detection scale that keeps OCR passes within a latency budget.
+
+    Detection cost grows roughly with the number of pixels, i.e. with the square of the
+    scale, so after every pass the controller nudges the scale towards
+    `scale * sqrt(target / measured)` using a smoothed latency. Changes are limited per
+    step and ignored inside a small dead band to keep the scale from oscillating.
+    """
+    def __init__(
+        self,
+        target_ms: float = 150.0,
+        initial_scale: float = 1.0,
+        min_scale: float = 0.25,
+        max_scale: float = 1.0,
+        smoothing: float = 0.3,
+        dead_band: float = 0.1,
+        max_step: float = 1.25,
+    ):
+        if target_ms <= 0:
+            raise ValueError("The latency target must be positive.")
+        self.target_ms = target_ms
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.smoothing = smoothing
+        self.dead_band = dead_band
+        self.max_step = max_step
+        self.scale = min(max_scale, max(min_scale, initial_scale))
+        self.smoothed_ms: Optional[float] = None
+
+    def update(self, latency_ms: float) -> float:
+        """Records the latency of one OCR pass and returns the scale for the next one."""
+        if self.smoothed_ms is None:
+            self.smoothed_ms = latency_ms
+        else:
+            self.smoothed_ms += self.smoothing * (latency_ms - self.smoothed_ms)
+
+        ratio = self.target_ms / max(self.smoothed_ms, 1e-3)
+        if abs(1.0 - ratio) <= self.dead_band:
+            return self.scale
+
+        factor = min(self.max_step, max(1.0 / self.max_step, ratio ** 0.5))
+        self.scale = min(self.max_scale, max(self.min_scale, self.scale * factor))
+        return self.scale
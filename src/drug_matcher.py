@@ -0,0 +1,163 @@
+import heapq
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+
+def decompose_jamo(text: str) -> str:
+    """
+    Decomposes Hangul syllables into their jamo and drops whitespace and punctuation.
+    OCR errors usually garble a single jamo, so comparing jamo keeps most of a syllable intact.
+    """
+    out = []
+    for ch in unicodedata.normalize("NFC", text).casefold():
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(_CHOSEONG[code // 588])
+            out.append(_JUNGSEONG[(code % 588) // 28])
+            out.append(_JONGSEONG[code % 28])
+        elif ch.isalnum():
+            out.append(ch)
+    return "".join(out)
+
+
+def _ngrams(jamo: str, n: int = 3) -> List[str]:
+    padded = f"^{jamo}$"
+    return list({padded[i:i + n] for i in range(max(1, len(padded) - n + 1))})
+
+
+def _levenshtein_ratio(a: str, b: str) -> float:
+    """Returns 1 - edit distance / max length, using Myers' bit-parallel algorithm."""
+    if not a or not b:
+        return 0.0
+    masks: Dict[str, int] = defaultdict(int)
+    for i, ch in enumerate(a):
+        masks[ch] |= 1 << i
+    full = (1 << len(a)) - 1
+    high = 1 << (len(a) - 1)
+    vp, vn, distance = full, 0, len(a)
+    for ch in b:
+        eq = masks.get(ch, 0)
+        d0 = ((((eq & vp) + vp) ^ vp) | eq | vn) & full
+        hp = vn | ~(d0 | vp)
+        hn = vp & d0
+        if hp & high:
+            distance += 1
+        elif hn & high:
+            distance -= 1
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = hn | ~(d0 | hp)
+        vn = hp & d0
+        vp &= full
+    return 1.0 - distance / max(len(a), len(b))
+
+
+class DrugNameMatcher:
+    """
+    Maps noisy OCR text to canonical drug product names.
+
+    Names are indexed by the trigrams of their jamo decomposition. A query gathers
+    candidates from the posting lists of its rarest trigrams only, which keeps scans short
+    on dictionaries of tens of thousands of names, then ranks the candidates by Dice
+    similarity over all trigrams and re-ranks the top few by edit distance over jamo.
+    """
+    def __init__(self, names: Iterable[str] = (), probe_grams: int = 4, candidates: int = 30, rerank: int = 5):
+        self.probe_grams = probe_grams
+        self.candidates = candidates
+        self.rerank = rerank
+        self._names: List[str] = []
+        self._jamo: List[str] = []
+        self._entry_grams: List[Tuple[int, ...]] = []
+        self._gram_ids: Dict[str, int] = {}
+        self._postings: List[List[int]] = []
+        self._seen: Dict[str, int] = {}
+        self.add_names(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "DrugNameMatcher":
+        """Builds a matcher from a text file with one product name per line."""
+        with open(path, "r", encoding="utf-8-sig") as f:
+            return cls((line.strip() for line in f if line.strip()), **kwargs)
+
+    def add_names(self, names: Iterable[str]):
+        """Adds product names to the index, ignoring duplicates."""
+        for name in names:
+            jamo = decompose_jamo(name)
+            if not jamo or jamo in self._seen:
+                continue
+            entry = len(self._names)
+            self._seen[jamo] = entry
+            self._names.append(name)
+            self._jamo.append(jamo)
+            gram_ids = []
+            for gram in _ngrams(jamo):
+                gram_id = self._gram_ids.get(gram)
+                if gram_id is None:
+                    gram_id = self._gram_ids[gram] = len(self._postings)
+                    self._postings.append([])
+                self._postings[gram_id].append(entry)
+                gram_ids.append(gram_id)
+            self._entry_grams.append(tuple(gram_ids))
+
+    def match(self, text: str, limit: int = 5, min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """Returns up to `limit` (canonical name, score) candidates, best first."""
+        jamo = decompose_jamo(text)
+        if not jamo or not self._names:
+            return []
+        exact = self._seen.get(jamo)
+        if exact is not None:
+            return [(self._names[exact], 1.0)]
+
+        query_grams = {self._gram_ids[g] for g in _ngrams(jamo) if g in self._gram_ids}
+        if not query_grams:
+            return []
+        postings = sorted((self._postings[g] for g in query_grams), key=len)
+        query_count = len(_ngrams(jamo))
+
+        # Only the rarest grams are used to gather candidates; a name sharing none of them
+        # cannot be a close match. Candidates are then scored exactly on all grams.
+        shared: Dict[int, int] = defaultdict(int)
+        for posting in postings[:self.probe_grams]:
+            for entry in posting:
+                shared[entry] += 1
+        candidates = heapq.nlargest(self.candidates, shared, key=shared.__getitem__)
+
+        scored = []
+        for entry in candidates:
+            entry_grams = self._entry_grams[entry]
+            common = sum(1 for g in entry_grams if g in query_grams)
+            scored.append((2.0 * common / (query_count + len(entry_grams)), entry))
+        scored = heapq.nlargest(max(limit, self.rerank), scored)
+
+        reranked = []
+        for i, (dice, entry) in enumerate(scored):
+            score = dice
+            if i < self.rerank:
+                score = 0.5 * dice + 0.5 * _levenshtein_ratio(jamo, self._jamo[entry])
+            if score >= min_score:
+                reranked.append((self._names[entry], score))
+        reranked.sort(key=lambda candidate: candidate[1], reverse=True)
+        return reranked[:limit]
+
+    def best_match(self, text: str, min_score: float = 0.5) -> Optional[Tuple[str, float]]:
+        """Returns the best (canonical name, score) for a text, or None below `min_score`."""
+        candidates = self.match(text, limit=1, min_score=min_score)
+        return candidates[0] if candidates else None
+
+    def best_of(self, texts: Iterable[str], min_score: float = 0.5) -> Optional[Tuple[str, float]]:
+        """Returns the best match over several OCR strings, e.g. all texts of one frame."""
+        best = None
+        for text in texts:
+            candidate = self.best_match(text, min_score)
+            if candidate is not None and (best is None or candidate[1] > best[1]):
+                best = candidate
+        return best
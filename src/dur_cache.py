@@ -0,0 +1,121 @@
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Optional, Tuple
+
+
+class DURCache:
+    """
+    A persistent SQLite cache for DUR API responses.
+
+    Entries are fresh for `ttl` seconds. After that they may still be served for up to
+    `stale_ttl` more seconds while the caller refreshes them in the background
+    (stale-while-revalidate). The cache holds at most `max_entries` responses and evicts
+    the least recently used ones first.
+    """
+    def __init__(
+        self,
+        path: str = "dur_cache.sqlite3",
+        ttl: float = 24 * 60 * 60,
+        stale_ttl: float = 7 * 24 * 60 * 60,
+        max_entries: int = 5000,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalizes a query string so that trivially different spellings share an entry."""
+        return " ".join(unicodedata.normalize("NFC", text or "").split()).casefold()
+
+    @classmethod
+    def make_key(cls, item_name: str, type_name: str, page_no: int, rows: int) -> str:
+        """Builds the cache key for a DUR query."""
+        return json.dumps([cls.normalize(item_name), cls.normalize(type_name), int(page_no), int(rows)])
+
+    def get(self, key: str) -> Tuple[Optional[dict], bool]:
+        """
+        Returns (payload, is_fresh) for a key.
+        The payload is None if the key is missing or too old to be served even as stale.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl + self.stale_ttl:
+                self.misses += 1
+                return None, False
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+            fresh = now - row[1] <= self.ttl
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+        return json.loads(row[0]), fresh
+
+    def put(self, key: str, payload: dict):
+        """Stores a response and evicts the least recently used entries beyond `max_entries`."""
+        now = time.time()
+        data = json.dumps(payload, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, data, now, now),
+            )
+            excess = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN"
+                    " (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+            self._conn.commit()
+
+    def clear(self):
+        """Removes all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """Returns hit, stale hit, miss and eviction counters plus the current entry count."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+        }
+
+    def close(self):
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,253 @@
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional
+
+from api_client import extract_items
+from dur_cache import DURCache
+
+# The bulk dataset fields kept in the index; everything else in the dumps is dropped.
+INDEXED_FIELDS = (
+    "TYPE_NAME",
+    "INGR_CODE",
+    "INGR_KOR_NAME",
+    "ITEM_SEQ",
+    "ITEM_NAME",
+    "ENTP_NAME",
+    "MIXTURE_INGR_CODE",
+    "MIXTURE_INGR_KOR_NAME",
+    "MIXTURE_ITEM_SEQ",
+    "MIXTURE_ITEM_NAME",
+    "MIXTURE_ENTP_NAME",
+    "PROHBT_CONTENT",
+    "REMARK",
+    "CHANGE_DATE",
+)
+# Dumps of the co-administration dataset alone often omit TYPE_NAME; such rows get this type.
+DEFAULT_TYPE_NAME = "병용금기"  # Contraindication
+KEY_FIELDS = ("TYPE_NAME", "ITEM_SEQ", "ITEM_NAME", "INGR_CODE", "MIXTURE_ITEM_SEQ", "MIXTURE_ITEM_NAME", "MIXTURE_INGR_CODE")
+
+
+def _name_key(text: str) -> str:
+    """Normalizes a product name for indexing: NFC, case-folded and without whitespace."""
+    return DURCache.normalize(text).replace(" ", "")
+
+
+def _read_rows(path: str) -> Iterator[dict]:
+    """Yields rows from a JSON or CSV dump of the DUR co-administration dataset."""
+    if path.lower().endswith(".json"):
+        with open(path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("response", data)
+            data = data.get("data") or extract_items(data)
+        yield from data
+        return
+
+    # Public CSV dumps are commonly CP949-encoded; fall back to it if UTF-8 fails.
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            with open(path, "r", encoding=encoding, newline="") as f:
+                rows = list(csv.DictReader(f))
+            yield from rows
+            return
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"Could not decode {path} as UTF-8 or CP949.")
+
+
+class DURIndex:
+    """
+    A local, indexed store of DUR contraindication records built from bulk dataset dumps.
+
+    Queries mirror `getUsjntTabooInfoList03`: they match product names by prefix and return
+    an API-shaped response, so callers cannot tell an offline answer from an online one.
+    Imports upsert rows by their natural key, so a delta dump can be applied on top of a
+    full one. Recent query results are kept in memory to answer repeated lookups instantly.
+    """
+    DEFAULT_PATH = "dur_index.sqlite3"
+
+    def __init__(self, path: str = DEFAULT_PATH, memo_size: int = 1024):
+        self.path = path
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[tuple, Optional[dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS contraindications ("
+            " row_key TEXT PRIMARY KEY,"
+            " name_key TEXT NOT NULL,"
+            + ", ".join(f" {field.lower()} TEXT" for field in INDEXED_FIELDS)
+            + ")"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS contraindications_name ON contraindications (type_name, name_key)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+
+    def import_rows(self, rows: Iterable[dict], replace: bool = False) -> int:
+        """
+        Upserts dataset rows into the index and returns the number of rows written.
+        With replace=True, existing records are removed first (a full reload).
+        """
+        columns = ["row_key", "name_key"] + [field.lower() for field in INDEXED_FIELDS]
+        sql = (
+            f"INSERT OR REPLACE INTO contraindications ({', '.join(columns)})"
+            f" VALUES ({', '.join('?' * len(columns))})"
+        )
+        count = 0
+        latest_change = self.meta("latest_change_date") or ""
+        with self._lock:
+            if replace:
+                self._conn.execute("DELETE FROM contraindications")
+            batch = []
+            for row in rows:
+                record = {field: str(row.get(field, "") or "").strip() for field in INDEXED_FIELDS}
+                if not record["ITEM_NAME"]:
+                    continue
+                record["TYPE_NAME"] = record["TYPE_NAME"] or DEFAULT_TYPE_NAME
+                values = [record[field] for field in INDEXED_FIELDS]
+                row_key = "\x1f".join(record[field] for field in KEY_FIELDS)
+                batch.append([row_key, _name_key(record["ITEM_NAME"])] + values)
+                latest_change = max(latest_change, record["CHANGE_DATE"])
+                if len(batch) >= 5000:
+                    self._conn.executemany(sql, batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                self._conn.executemany(sql, batch)
+                count += len(batch)
+            self._set_meta("latest_change_date", latest_change)
+            self._set_meta("imported_at", str(time.time()))
+            self._conn.commit()
+            self._memo.clear()
+        return count
+
+    def import_file(self, path: str, replace: bool = False) -> int:
+        """Imports a JSON or CSV dump and returns the number of rows written."""
+        return self.import_rows(_read_rows(path), replace=replace)
+
+    def query(
+        self,
+        item_name: str,
+        type_name: str = "병용금기",  # Contraindication
+        page_no: int = 1,
+        rows: int = 3,
+    ) -> Optional[dict]:
+        """
+        Returns an API-shaped response for products whose name starts with `item_name`,
+        or None if the index has no matching records.
+        """
+        key = (_name_key(item_name), type_name, int(page_no), int(rows))
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+
+            name_key = key[0]
+            if not name_key:
+                return None
+            where = "type_name = ? AND name_key >= ? AND name_key < ?"
+            params = (type_name, name_key, name_key + "\U0010ffff")
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM contraindications WHERE {where}", params
+            ).fetchone()[0]
+            response = None
+            if total:
+                fields = ", ".join(field.lower() for field in INDEXED_FIELDS)
+                records = self._conn.execute(
+                    f"SELECT {fields} FROM contraindications WHERE {where}"
+                    " ORDER BY name_key, row_key LIMIT ? OFFSET ?",
+                    params + (int(rows), (int(page_no) - 1) * int(rows)),
+                ).fetchall()
+                response = {
+                    "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE (offline index)"},
+                    "body": {
+                        "pageNo": int(page_no),
+                        "numOfRows": int(rows),
+                        "totalCount": total,
+                        "items": [dict(zip(INDEXED_FIELDS, record)) for record in records],
+                    },
+                }
+
+            self._memo[key] = response
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return response
+
+    def product_names(self) -> List[str]:
+        """Returns every distinct product name in the index, including co-administered products."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item_name FROM contraindications UNION SELECT mixture_item_name FROM contraindications"
+            ).fetchall()
+        return [row[0] for row in rows if row[0]]
+
+    def meta(self, key: str) -> Optional[str]:
+        """Returns a metadata value such as `latest_change_date` or `imported_at`."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def stats(self) -> dict:
+        """Returns the number of indexed records and the import metadata."""
+        with self._lock:
+            records = self._conn.execute("SELECT COUNT(*) FROM contraindications").fetchone()[0]
+        return {
+            "records": records,
+            "latest_change_date": self.meta("latest_change_date"),
+            "imported_at": self.meta("imported_at"),
+        }
+
+    def close(self):
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build and inspect the offline DUR contraindication index.")
+    parser.add_argument("--db", default=DURIndex.DEFAULT_PATH, help="Path of the index database.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Import JSON/CSV dumps (full or delta).")
+    import_parser.add_argument("files", nargs="+", help="Dataset dump files to import.")
+    import_parser.add_argument("--replace", action="store_true", help="Drop existing records before importing.")
+
+    subparsers.add_parser("stats", help="Show index statistics.")
+
+    query_parser = subparsers.add_parser("query", help="Look up a product name.")
+    query_parser.add_argument("item_name")
+    query_parser.add_argument("--rows", type=int, default=10)
+
+    args = parser.parse_args(argv)
+    index = DURIndex(args.db)
+    try:
+        if args.command == "import":
+            for i, path in enumerate(args.files):
+                if not os.path.exists(path):
+                    print(f"File not found: {path}", file=sys.stderr)
+                    return 1
+                count = index.import_file(path, replace=args.replace and i == 0)
+                print(f"Imported {count} rows from {path}.")
+        elif args.command == "stats":
+            print(json.dumps(index.stats(), ensure_ascii=False, indent=2))
+        elif args.command == "query":
+            response = index.query(args.item_name, rows=args.rows)
+            print(json.dumps(response, ensure_ascii=False, indent=2))
+    finally:
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
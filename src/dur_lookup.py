@@ -0,0 +1,56 @@
+from concurrent.futures import Future
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from api_client import DURClient
+from dur_prefetch import DURPrefetcher
+
+
+class DURLookupService(QObject):
+    """
+    Runs DUR lookups off the GUI thread and reports their progress through Qt signals.
+    Signals are emitted from worker threads, so connected slots run queued on the GUI thread.
+    """
+    items_ready = Signal(str, list)  # item name, items of one result page
+    finished = Signal(str, int)      # item name, total number of items
+    failed = Signal(str, str)        # item name, error message
+
+    def __init__(self, client: DURClient, rows_per_page: int = 100, parent: QObject = None):
+        super().__init__(parent)
+        self.client = client
+        self.rows_per_page = rows_per_page
+        self.prefetcher = DURPrefetcher(client, rows=rows_per_page)
+
+    def lookup(self, item_name: str) -> Future:
+        """
+        Starts a lookup of all result pages for an item and returns its future.
+        If the item is already being fetched or was prefetched, that lookup is reused
+        and its items are delivered as a whole.
+        """
+        def on_page(page_no: int, items: list):
+            if items:
+                self.items_ready.emit(item_name, items)
+
+        future, started = self.prefetcher.get(item_name, on_page=on_page)
+        if not started:
+            future.add_done_callback(lambda f: self._emit_all(item_name, f))
+        future.add_done_callback(lambda f: self._on_done(item_name, f))
+        return future
+
+    def prefetch(self, item_name: str) -> Optional[Future]:
+        """Speculatively starts a lookup so that a later `lookup` resolves instantly."""
+        return self.prefetcher.prefetch(item_name)
+
+    def _emit_all(self, item_name: str, future: Future):
+        if not future.cancelled() and future.exception() is None and future.result():
+            self.items_ready.emit(item_name, future.result())
+
+    def _on_done(self, item_name: str, future: Future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.failed.emit(item_name, str(error))
+        else:
+            self.finished.emit(item_name, len(future.result()))
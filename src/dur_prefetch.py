@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from api_client import DURClient
+from dur_cache import DURCache
+
+
+class StableTextTracker:
+    """Reports an OCR text once it has stayed the top result for `stable_frames` consecutive frames."""
+
+    def __init__(self, stable_frames: int = 10, repeat_frames: int = 50):
+        self.stable_frames = stable_frames
+        self.repeat_frames = repeat_frames
+        self._text = ""
+        self._count = 0
+
+    def update(self, texts: List[str]) -> Optional[str]:
+        """
+        Feeds the texts of one frame. Returns the text on the frame where it becomes stable
+        and again every `repeat_frames` frames while it stays, so that a prefetch refused by
+        the budget is retried; returns None otherwise.
+        """
+        text = (texts[0] if texts else "").strip()
+        if text != self._text:
+            self._text = text
+            self._count = 0
+        if not text:
+            return None
+        self._count += 1
+        since_stable = self._count - self.stable_frames
+        return text if since_stable >= 0 and since_stable % self.repeat_frames == 0 else None
+
+
+class DURPrefetcher:
+    """
+    Shares DUR lookups between speculative prefetches and user requests.
+
+    Lookups are single-flight: asking for an item that is already being fetched (or was
+    fetched within the last `max_age` seconds) returns the same future. Older results are
+    looked up again, which goes back through the DUR cache and its expiry rules. Speculative prefetches are limited to
+    `max_in_flight` concurrent and `max_per_minute` started lookups so that a camera aimed
+    at changing labels cannot flood the API; explicit requests are never limited.
+    """
+    def __init__(
+        self,
+        client: DURClient,
+        rows: int = 100,
+        max_in_flight: int = 2,
+        max_per_minute: int = 10,
+        max_entries: int = 32,
+        max_age: float = 300.0,
+    ):
+        self.client = client
+        self.rows = rows
+        self.max_in_flight = max_in_flight
+        self.max_per_minute = max_per_minute
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self.prefetch_count = 0
+        self.shared_count = 0
+        self.rejected_count = 0
+
+        self._lock = threading.Lock()
+        self._futures: "OrderedDict[str, Tuple[Future, float]]" = OrderedDict()  # key -> (future, started)
+        self._prefetch_starts = deque()
+
+    @staticmethod
+    def _key(item_name: str) -> str:
+        return DURCache.normalize(item_name)
+
+    def _existing(self, key: str) -> Optional[Future]:
+        entry = self._futures.get(key)
+        if entry is None:
+            return None
+        future, started = entry
+        if future.done() and (
+            future.cancelled() or future.exception() is not None or time.monotonic() - started > self.max_age
+        ):
+            del self._futures[key]
+            return None
+        self._futures.move_to_end(key)
+        return future
+
+    def _start(self, key: str, item_name: str, on_page: Optional[Callable[[int, list], None]]) -> Future:
+        future = self.client.fetch_all_interactions_async(item_name, rows=self.rows, on_page=on_page)
+        self._futures[key] = (future, time.monotonic())
+        while len(self._futures) > self.max_entries:
+            self._futures.popitem(last=False)
+        return future
+
+    def get(
+        self, item_name: str, on_page: Optional[Callable[[int, list], None]] = None
+    ) -> Tuple[Future, bool]:
+        """
+        Returns (future of all items, started) for an explicit lookup.
+        `started` is False when an existing lookup was shared; `on_page` is then not called.
+        """
+        key = self._key(item_name)
+        with self._lock:
+            future = self._existing(key)
+            if future is not None:
+                self.shared_count += 1
+                return future, False
+            return self._start(key, item_name, on_page), True
+
+    def prefetch(self, item_name: str) -> Optional[Future]:
+        """Starts a speculative lookup if the budget allows; returns its future or None."""
+        key = self._key(item_name)
+        now = time.monotonic()
+        with self._lock:
+            future = self._existing(key)
+            if future is not None:
+                return future
+
+            while self._prefetch_starts and now - self._prefetch_starts[0] > 60.0:
+                self._prefetch_starts.popleft()
+            in_flight = sum(1 for f, _ in self._futures.values() if not f.done())
+            if in_flight >= self.max_in_flight or len(self._prefetch_starts) >= self.max_per_minute:
+                self.rejected_count += 1
+                return None
+
+            self._prefetch_starts.append(now)
+            self.prefetch_count += 1
+            return self._start(key, item_name, None)
+
+    def stats(self) -> dict:
+        """Returns prefetch, shared and rejected lookup counters."""
+        return {
+            "prefetched": self.prefetch_count,
+            "shared": self.shared_count,
+            "rejected": self.rejected_count,
+        }
@@ -0,0 +1,163 @@
+import sys
+from bisect import bisect_right
+from typing import Dict, List, Set, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+
+class DURTableModel(QAbstractTableModel):
+    """
+    A table of DUR results stored as one list of strings per column.
+
+    Rows are deduplicated on (ingredient, product, reason), and repeated strings are interned so
+    that the many rows sharing an ingredient or product keep a single copy of it. Filtering and
+    sorting are done in the model through a list of visible row ids, so a page of results is
+    inserted with a few `beginInsertRows` calls instead of one per row, and the view only ever
+    asks for the rows it shows.
+    """
+    COLUMNS = ("Ingredient", "Product Name", "Reason for Contraindication")
+    FIELDS = ("MIXTURE_INGR_KOR_NAME", "MIXTURE_ITEM_NAME", "PROHBT_CONTENT")
+
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self._columns: Tuple[List[str], ...] = tuple([] for _ in self.COLUMNS)
+        self._seen: Set[Tuple[str, str, str]] = set()
+        # Visible row ids, in ascending order of the sort column (or insertion order if unsorted).
+        self._order: List[int] = []
+        self._sort_keys: List[Tuple[str, int]] = []
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._filter_text = ""
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        return self._columns[index.column()][self._row_id(index.row())]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return section + 1
+
+    def _row_id(self, row: int) -> int:
+        if self._sort_column >= 0 and self._sort_order == Qt.SortOrder.DescendingOrder:
+            return self._order[len(self._order) - 1 - row]
+        return self._order[row]
+
+    def _matches(self, row_id: int) -> bool:
+        return not self._filter_text or any(
+            self._filter_text in column[row_id].casefold() for column in self._columns
+        )
+
+    def add_items(self, items: List[dict]) -> int:
+        """
+        Appends DUR result items that are not in the table yet and returns the number added.
+        Items without any of the three fields are ignored.
+        """
+        first_id = len(self._columns[0])
+        for item in items:
+            row = tuple(sys.intern(str(item.get(field, "") or "")) for field in self.FIELDS)
+            if not any(row) or row in self._seen:
+                continue
+            self._seen.add(row)
+            for column, value in zip(self._columns, row):
+                column.append(value)
+
+        new_ids = [row_id for row_id in range(first_id, len(self._columns[0])) if self._matches(row_id)]
+        if self._sort_column < 0:
+            if new_ids:
+                start = len(self._order)
+                self.beginInsertRows(QModelIndex(), start, start + len(new_ids) - 1)
+                self._order.extend(new_ids)
+                self.endInsertRows()
+        else:
+            self._insert_sorted(new_ids)
+        return len(self._columns[0]) - first_id
+
+    def _insert_sorted(self, row_ids: List[int]):
+        """Inserts rows into the sorted order, one `beginInsertRows` per contiguous run."""
+        keys = sorted((self._columns[self._sort_column][row_id], row_id) for row_id in row_ids)
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+        run_start = 0
+        while run_start < len(keys):
+            position = bisect_right(self._sort_keys, keys[run_start])
+            run_end = run_start + 1
+            while run_end < len(keys) and (
+                position == len(self._sort_keys) or keys[run_end] < self._sort_keys[position]
+            ):
+                run_end += 1
+            run = keys[run_start:run_end]
+            first = len(self._order) - position if descending else position
+            self.beginInsertRows(QModelIndex(), first, first + len(run) - 1)
+            self._sort_keys[position:position] = run
+            self._order[position:position] = [row_id for _, row_id in run]
+            self.endInsertRows()
+            run_start = run_end
+
+    def _rebuild_order(self):
+        """Recomputes the visible rows from the filter and the sort column."""
+        row_ids = [row_id for row_id in range(len(self._columns[0])) if self._matches(row_id)]
+        if self._sort_column < 0:
+            self._order = row_ids
+            self._sort_keys = []
+        else:
+            column = self._columns[self._sort_column]
+            self._sort_keys = sorted((column[row_id], row_id) for row_id in row_ids)
+            self._order = [row_id for _, row_id in self._sort_keys]
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Sorts the rows by a column; a negative column restores insertion order."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_ids = [self._row_id(index.row()) for index in persistent]
+
+        self._sort_column = column if 0 <= column < len(self.COLUMNS) else -1
+        self._sort_order = order
+        self._rebuild_order()
+
+        rows: Dict[int, int] = {row_id: row for row, row_id in enumerate(self._order)}
+        if self._sort_column >= 0 and order == Qt.SortOrder.DescendingOrder:
+            last = len(self._order) - 1
+            rows = {row_id: last - row for row_id, row in rows.items()}
+        self.changePersistentIndexList(persistent, [
+            self.index(rows[row_id], index.column()) if row_id in rows else QModelIndex()
+            for index, row_id in zip(persistent, persistent_ids)
+        ])
+        self.layoutChanged.emit()
+
+    def set_filter(self, text: str):
+        """Shows only rows that contain `text` (case-insensitively) in any column."""
+        text = text.strip().casefold()
+        if text == self._filter_text:
+            return
+        self.beginResetModel()
+        self._filter_text = text
+        self._rebuild_order()
+        self.endResetModel()
+
+    def clear(self):
+        """Removes all rows."""
+        self.beginResetModel()
+        for column in self._columns:
+            column.clear()
+        self._seen.clear()
+        self._order = []
+        self._sort_keys = []
+        self.endResetModel()
+
+    @property
+    def sort_column(self) -> int:
+        """The column the rows are sorted by, or -1 while they are in insertion order."""
+        return self._sort_column
+
+    def total_rows(self) -> int:
+        """Returns the number of stored rows, including rows hidden by the filter."""
+        return len(self._columns[0])
@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+from perf import perf
+
+
+class FrameHandoff:
+    """
+    Latest-wins frame handoff between a producer thread and the Qt UI thread.
+
+    Frames are written into a small pool of preallocated BGR buffers. Every buffer is either
+    free, being written by the producer, pending for the UI, or being displayed, so a pool
+    of three never blocks the producer. Publishing a frame while another one is still
+    pending drops the older one instead of queueing it, so a slow UI only ever sees the
+    newest frame and memory stays bounded.
+    """
+    def __init__(self, pool_size: int = 3):
+        if pool_size < 3:
+            raise ValueError("The frame pool needs at least three buffers.")
+        self._lock = threading.Lock()
+        self._buffers: List[Optional[np.ndarray]] = [None] * pool_size
+        self._free = list(range(pool_size))
+        self._pending: Optional[Tuple[int, list, float]] = None
+        self._displaying: Optional[int] = None
+
+        self.emitted_frames = 0
+        self.displayed_frames = 0
+        self.dropped_frames = 0
+
+    def acquire(self, shape: Tuple[int, ...]) -> Tuple[int, np.ndarray]:
+        """Returns (index, buffer) of a free buffer with the given shape for the producer to fill."""
+        with self._lock:
+            index = self._free.pop()
+        buffer = self._buffers[index]
+        if buffer is None or buffer.shape != tuple(shape):
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._buffers[index] = buffer
+        return index, buffer
+
+    def commit(self, index: int, texts: list) -> bool:
+        """
+        Publishes a filled buffer as the latest frame.
+        Returns True if the UI needs to be notified, i.e. no older frame was still pending.
+        """
+        with self._lock:
+            previous = self._pending
+            self._pending = (index, texts, time.perf_counter())
+            self.emitted_frames += 1
+            if previous is not None:
+                self._free.append(previous[0])
+                self.dropped_frames += 1
+                return False
+            return True
+
+    def take(self) -> Optional[Tuple[QImage, list]]:
+        """
+        Returns the newest frame as a QImage that wraps the pooled buffer, plus its texts.
+        The image stays valid until the next call to `take`, so it must be converted
+        (e.g. with QPixmap.fromImage) before then.
+        """
+        with self._lock:
+            if self._pending is None:
+                return None
+            if self._displaying is not None:
+                self._free.append(self._displaying)
+            index, texts, committed_at = self._pending
+            self._pending = None
+            self._displaying = index
+            self.displayed_frames += 1
+
+        perf.record("ui.frame_delivery", (time.perf_counter() - committed_at) * 1000.0)
+        buffer = self._buffers[index]
+        h, w = buffer.shape[:2]
+        image = QImage(buffer.data, w, h, buffer.strides[0], QImage.Format.Format_BGR888)
+        return image, texts
+
+    def stats(self) -> dict:
+        """Returns the emitted, displayed and dropped frame counters."""
+        return {
+            "emitted": self.emitted_frames,
+            "displayed": self.displayed_frames,
+            "dropped": self.dropped_frames,
+        }
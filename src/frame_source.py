@@ -0,0 +1,207 @@
+import glob
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence, Tuple, Union
+
+import cv2 as cv
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp")
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".wmv", ".m4v")
+
+
+class FrameSource(ABC):
+    """
+    A source of BGR frames.
+    Mirrors the part of the cv.VideoCapture interface that OCRCamera uses, so a camera,
+    a recorded video, an image sequence or synthetic frames can be swapped in freely.
+    """
+    @abstractmethod
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        ...
+
+    @abstractmethod
+    def isOpened(self) -> bool:
+        ...
+
+    def release(self):
+        pass
+
+
+class CameraSource(FrameSource):
+    """Frames from a camera device."""
+
+    def __init__(self, cam_index: int = 0):
+        self.cap = cv.VideoCapture(cam_index, cv.CAP_DSHOW if os.name == "nt" else 0)
+        if not self.cap.isOpened():
+            raise RuntimeError("Cannot open camera")
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        return self.cap.read()
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """
+    Frames from a video file, optionally looped and/or paced at the video's frame rate
+    to imitate a live camera.
+    """
+    def __init__(self, path: str, loop: bool = False, realtime: bool = False):
+        self.path = path
+        self.loop = loop
+        self.cap = cv.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Cannot open video file {path}")
+        fps = self.cap.get(cv.CAP_PROP_FPS) or 30.0
+        self._interval = 1.0 / fps if realtime else 0.0
+        self._next_time = time.monotonic()
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        ok, frame = self.cap.read()
+        if not ok and self.loop:
+            self.cap.set(cv.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read()
+        if ok and self._interval:
+            delay = self._next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_time = max(self._next_time, time.monotonic() - self._interval) + self._interval
+        return ok, frame
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageSequenceSource(FrameSource):
+    """Frames from a list of image files, a directory or a glob pattern."""
+
+    EXTENSIONS = IMAGE_EXTENSIONS
+
+    def __init__(self, images: Union[str, Sequence[str]], loop: bool = False):
+        if isinstance(images, str):
+            if os.path.isdir(images):
+                images = [
+                    os.path.join(images, name) for name in os.listdir(images)
+                    if name.lower().endswith(self.EXTENSIONS)
+                ]
+            else:
+                images = glob.glob(images)
+        self.paths: List[str] = sorted(images)
+        if not self.paths:
+            raise RuntimeError("The image sequence is empty")
+        self.loop = loop
+        self._position = 0
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._position >= len(self.paths):
+            if not self.loop:
+                return False, None
+            self._position = 0
+        frame = cv.imread(self.paths[self._position], cv.IMREAD_COLOR)
+        self._position += 1
+        return frame is not None, frame
+
+    def isOpened(self) -> bool:
+        return self._position < len(self.paths) or self.loop
+
+
+class SyntheticLabelSource(FrameSource):
+    """
+    Renders medicine labels onto a textured background with jitter and sensor noise.
+
+    The same seed always produces the same frames, which makes it suitable for reproducible
+    benchmarks and tests without a camera. `current_text` holds the ground truth of the
+    last frame. Each label is held for `hold_frames` frames, like a box held under a camera.
+    """
+    def __init__(
+        self,
+        texts: Sequence[str] = ("타이레놀정500밀리그람", "니조랄정", "아스피린프로텍트정100mg"),
+        size: Tuple[int, int] = (640, 480),
+        font_path: str = "assets/NoonnuBasicGothicRegular.ttf",
+        font_size: int = 40,
+        hold_frames: int = 30,
+        num_frames: Optional[int] = None,
+        jitter: int = 6,
+        noise: float = 4.0,
+        seed: int = 0,
+    ):
+        self.texts = list(texts)
+        self.size = size
+        self.hold_frames = hold_frames
+        self.num_frames = num_frames
+        self.jitter = jitter
+        self.noise = noise
+        self.current_text = ""
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed)
+        self._frame_index = 0
+        try:
+            self._font = ImageFont.truetype(font_path, font_size)
+        except IOError:
+            self._font = ImageFont.load_default()
+        self._labels = [self._render_label(text) for text in self.texts]
+        w, h = size
+        gradient = np.linspace(150, 210, w, dtype=np.float32)[None, :, None]
+        self._background = np.repeat(np.repeat(gradient, h, axis=0), 3, axis=2)
+
+    def _render_label(self, text: str) -> np.ndarray:
+        left, top, right, bottom = self._font.getbbox(text)
+        padding = 16
+        label = Image.new("RGB", (right - left + 2 * padding, bottom - top + 2 * padding), (250, 250, 245))
+        ImageDraw.Draw(label).text((padding - left, padding - top), text, font=self._font, fill=(20, 20, 20))
+        return cv.cvtColor(np.asarray(label), cv.COLOR_RGB2BGR)
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.num_frames is not None and self._frame_index >= self.num_frames:
+            return False, None
+        label_index = (self._frame_index // self.hold_frames) % len(self.texts)
+        self._frame_index += 1
+        label = self._labels[label_index]
+        self.current_text = self.texts[label_index]
+
+        frame = self._background.copy()
+        w, h = self.size
+        lh, lw = label.shape[:2]
+        x = max(0, (w - lw) // 2 + self._rng.randint(-self.jitter, self.jitter))
+        y = max(0, (h - lh) // 2 + self._rng.randint(-self.jitter, self.jitter))
+        lw, lh = min(lw, w - x), min(lh, h - y)
+        frame[y:y + lh, x:x + lw] = label[:lh, :lw]
+        if self.noise:
+            frame += self._np_rng.normal(0.0, self.noise, frame.shape).astype(np.float32)
+        return True, np.clip(frame, 0, 255).astype(np.uint8)
+
+    def isOpened(self) -> bool:
+        return self.num_frames is None or self._frame_index < self.num_frames
+
+
+class PacedSource(FrameSource):
+    """Wraps another source and delivers its frames at most `fps` times per second, like a camera."""
+
+    def __init__(self, source: FrameSource, fps: float = 30.0):
+        self.source = source
+        self._interval = 1.0 / fps
+        self._next_time = time.monotonic()
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        delay = self._next_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_time = max(self._next_time, time.monotonic() - self._interval) + self._interval
+        return self.source.read()
+
+    def isOpened(self) -> bool:
+        return self.source.isOpened()
+
+    def release(self):
+        self.source.release()
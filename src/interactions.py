@@ -0,0 +1,165 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+from dur_cache import DURCache
+
+
+def _key(text: str) -> str:
+    return DURCache.normalize(text).replace(" ", "")
+
+
+class InteractionEngine:
+    """
+    Keeps an up-to-date conflict matrix for the current medicine list.
+
+    Every drug contributes its own ingredients and the ingredients/products it must not be
+    combined with (taken from its DUR contraindication rows). Inverted indices map each
+    ingredient and product to the drugs that contain or forbid it, so adding DUR rows for
+    one drug only looks up the pairs those rows can create instead of re-checking the
+    whole list. The work per change is proportional to the rows involved, not to n^2.
+    """
+    def __init__(self):
+        self._refcounts: Dict[str, int] = {}
+        self._names: Dict[str, str] = {}  # key -> display name
+        self._ingredients: Dict[str, Set[str]] = defaultdict(set)
+        self._forbidden: Dict[str, Dict[str, str]] = defaultdict(dict)  # drug -> forbidden key -> reason
+
+        self._containing: Dict[str, Set[str]] = defaultdict(set)  # ingredient/product key -> drugs
+        self._forbidding: Dict[str, Set[str]] = defaultdict(set)  # ingredient/product key -> drugs
+
+        self._conflicts: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+
+    def __contains__(self, name: str) -> bool:
+        return _key(name) in self._refcounts
+
+    def __len__(self) -> int:
+        return len(self._refcounts)
+
+    def add_drug(self, name: str, dur_items: Iterable[dict] = ()) -> List[Tuple[str, str, str]]:
+        """
+        Adds a drug (or another reference to it) and optionally its DUR rows.
+        Returns the newly found conflicts as (drug, other drug, reason) tuples.
+        """
+        key = _key(name)
+        new_conflicts = []
+        if key not in self._refcounts:
+            self._refcounts[key] = 0
+            self._names[key] = name
+            new_conflicts = self._link_containing(key, key)
+        self._refcounts[key] += 1
+        return self._report(new_conflicts + self._merge_dur_items(key, dur_items))
+
+    def add_dur_items(self, name: str, dur_items: Iterable[dict]) -> List[Tuple[str, str, str]]:
+        """
+        Merges DUR contraindication rows of a drug that is already on the list.
+        Rows can arrive page by page; only pairs created by the new rows are computed.
+        """
+        key = _key(name)
+        if key not in self._refcounts:
+            return []
+        return self._report(self._merge_dur_items(key, dur_items))
+
+    def _merge_dur_items(self, key: str, dur_items: Iterable[dict]) -> List[Tuple[str, str, str]]:
+        new_conflicts = []
+        for item in dur_items:
+            reason = str(item.get("PROHBT_CONTENT", "") or "")
+            ingredient = _key(str(item.get("INGR_KOR_NAME", "") or ""))
+            if ingredient and ingredient not in self._ingredients[key]:
+                self._ingredients[key].add(ingredient)
+                new_conflicts += self._link_containing(key, ingredient)
+
+            for field in ("MIXTURE_INGR_KOR_NAME", "MIXTURE_ITEM_NAME"):
+                forbidden = _key(str(item.get(field, "") or ""))
+                if forbidden and forbidden not in self._forbidden[key]:
+                    self._forbidden[key][forbidden] = reason
+                    new_conflicts += self._link_forbidding(key, forbidden, reason)
+        return new_conflicts
+
+    def _report(self, conflicts: List[Tuple[str, str, str]]) -> List[Tuple[str, str, str]]:
+        """Returns each newly conflicting pair once, with display names."""
+        seen = set()
+        reported = []
+        for a, b, reason in conflicts:
+            pair = frozenset((a, b))
+            if pair not in seen:
+                seen.add(pair)
+                reported.append((self._names[a], self._names[b], reason))
+        return reported
+
+    def _link_containing(self, drug: str, ingredient: str) -> List[Tuple[str, str, str]]:
+        self._containing[ingredient].add(drug)
+        found = []
+        for other in self._forbidding.get(ingredient, ()):
+            if other != drug:
+                reason = self._forbidden[other][ingredient]
+                if self._record(drug, other, reason):
+                    found.append((drug, other, reason))
+        return found
+
+    def _link_forbidding(self, drug: str, forbidden: str, reason: str) -> List[Tuple[str, str, str]]:
+        self._forbidding[forbidden].add(drug)
+        found = []
+        for other in self._containing.get(forbidden, ()):
+            if other != drug and self._record(drug, other, reason):
+                found.append((drug, other, reason))
+        return found
+
+    def _record(self, a: str, b: str, reason: str) -> bool:
+        """Records a conflict reason for a pair; returns False if it was already known."""
+        if reason in self._conflicts.get(a, {}).get(b, ()):
+            return False
+        self._conflicts[a][b].add(reason)
+        self._conflicts[b][a].add(reason)
+        return True
+
+    def remove_drug(self, name: str):
+        """Removes one reference to a drug; its conflicts go away with the last reference."""
+        key = _key(name)
+        if key not in self._refcounts:
+            return
+        self._refcounts[key] -= 1
+        if self._refcounts[key] > 0:
+            return
+
+        del self._refcounts[key]
+        del self._names[key]
+        for ingredient in self._ingredients.pop(key, set()) | {key}:
+            self._discard(self._containing, ingredient, key)
+        for forbidden in self._forbidden.pop(key, {}):
+            self._discard(self._forbidding, forbidden, key)
+        for other in self._conflicts.pop(key, {}):
+            self._conflicts[other].pop(key, None)
+            if not self._conflicts[other]:
+                del self._conflicts[other]
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], term: str, drug: str):
+        drugs = index.get(term)
+        if drugs is not None:
+            drugs.discard(drug)
+            if not drugs:
+                del index[term]
+
+    def conflicts_for(self, name: str) -> Dict[str, List[str]]:
+        """Returns {other drug: reasons} for every drug on the list that conflicts with `name`."""
+        conflicts = self._conflicts.get(_key(name), {})
+        return {self._names[other]: sorted(reasons) for other, reasons in conflicts.items()}
+
+    def conflicting_pairs(self) -> List[Tuple[str, str, List[str]]]:
+        """Returns every conflicting pair once, as (drug, other drug, reasons)."""
+        return [
+            (self._names[a], self._names[b], sorted(reasons))
+            for a, others in self._conflicts.items()
+            for b, reasons in others.items()
+            if a < b
+        ]
+
+    def conflict_matrix(self) -> Tuple[List[str], List[List[bool]]]:
+        """Returns (drug names, n x n matrix) where matrix[i][j] is True if drugs i and j conflict."""
+        keys = list(self._refcounts)
+        positions = {key: i for i, key in enumerate(keys)}
+        matrix = [[False] * len(keys) for _ in keys]
+        for a, others in self._conflicts.items():
+            for b in others:
+                matrix[positions[a]][positions[b]] = True
+        return [self._names[key] for key in keys], matrix
@@ -1,92 +1,309 @@
+import argparse
+import os
 import sys
-from typing import List
-import cv2 as cv
-import numpy as np
+import threading
+from functools import partial
+from typing import List, Optional, Tuple
 import yaml
-from PySide6.QtCore import QThread, Signal, Slot, QObject
-from PySide6.QtGui import QImage, QPixmap, QStandardItemModel, QStandardItem
-from PySide6.QtWidgets import QApplication, QMainWindow, QHeaderView, QTableView
+from PySide6.QtCore import QModelIndex, Qt, QThread, QTimer, Signal, Slot, QObject
+from PySide6.QtGui import QBrush, QColor, QImage, QPixmap, QStandardItemModel, QStandardItem
+from PySide6.QtWidgets import QApplication, QGridLayout, QMainWindow, QHeaderView, QLabel, QTableView
 from ui_final import Ui_MainWindow
 from api_client import DURClient
+from cpu_backend import BACKENDS
+from dur_cache import DURCache
+from dur_index import DURIndex
+from dur_lookup import DURLookupService
+from drug_matcher import DrugNameMatcher
+from dur_prefetch import StableTextTracker
+from dur_table_model import DURTableModel
+from frame_handoff import FrameHandoff
+from frame_source import FrameSource
+from interactions import InteractionEngine
 from ocr import UIOCRCamera
+from ocr_process import OCRProcessEngine
+from ocr_service import OCRService
+from perf import perf
+from pipeline import FrameScheduler
 
 class OCRWorker(QThread):
     """
     A QThread worker for performing OCR in the background.
     """
-    frame_ready = Signal(QImage, list)
+    frame_ready = Signal()  # A new frame is available through take_frame().
     error = Signal(str)
+    ocr_ready = Signal()
 
-    def __init__(self, cam_index: int = 0, gpu: bool = True, parent: QObject = None):
+    def __init__(
+        self,
+        cam_index: int = 0,
+        gpu: bool = True,
+        target_ocr_fps: float = 5.0,
+        use_process: bool = False,
+        source: Optional[FrameSource] = None,
+        ocr_service: Optional[OCRService] = None,
+        camera_options: Optional[dict] = None,
+        backend: str = "default",
+        cpu_threads: Optional[int] = None,
+        parent: QObject = None,
+    ):
         super().__init__(parent)
-        font_path = "assets/NoonnuBasicGothicRegular.ttf"
+        # `camera_options` are extra UIOCRCamera arguments (e.g. ocr_mode or skip_unchanged_frames).
+        camera_options = {
+            "languages": ["ko", "en"],
+            "gpu": gpu,
+            "backend": backend,
+            "cpu_threads": cpu_threads,
+            "font_path": "assets/NoonnuBasicGothicRegular.ttf",
+            **(camera_options or {}),
+        }
+        reader_options = {key: camera_options[key] for key in ("languages", "gpu", "backend", "cpu_threads")}
         self._camera = UIOCRCamera(
-            languages=["ko", "en"], gpu=gpu, cam_index=cam_index, font_path=font_path
+            cam_index=cam_index, source=source, load_reader=not (use_process or ocr_service), **camera_options
         )
+        # A shared service (one reader for all cameras) takes precedence over a private process.
+        self._ocr_service = ocr_service
+        self._ocr_engine = None
+        if ocr_service is not None:
+            self._camera.inference_backend = ocr_service.recognize
+        elif use_process:
+            self._ocr_engine = OCRProcessEngine(camera_kwargs=reader_options)
+            self._camera.inference_backend = self._ocr_engine.recognize
+        self._scheduler = FrameScheduler(
+            read_frame=self._camera.read_frame,
+            recognize=self._camera.recognize,
+            target_ocr_fps=target_ocr_fps,
+        )
+        self._handoff = FrameHandoff()
         self._is_running = True
 
     def run(self):
         """
-        Continuously captures frames from the camera, processes them, and emits the result.
+        Displays every captured frame with the most recent OCR result drawn over it.
+        Capture and OCR run in their own stages, so the preview keeps the camera's
+        frame rate while OCR runs at most at the configured target rate.
         """
+        self._scheduler.start()
+        ocr_announced = False
+        error_announced = False
         try:
             while self._is_running:
-                annotated_bgr, texts = self._camera.read_and_annotate()
-                rgb_image = cv.cvtColor(annotated_bgr, cv.COLOR_BGR2RGB)
-                h, w, ch = rgb_image.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-                self.frame_ready.emit(qt_image.copy(), texts)
-                self.msleep(10)  # Small delay to prevent high CPU usage
+                if not ocr_announced and self.is_ocr_ready():
+                    ocr_announced = True
+                    self.ocr_ready.emit()
+                if not error_announced and self.ocr_error() is not None:
+                    # The preview keeps running without OCR; report the failure once.
+                    error_announced = True
+                    self.error.emit(f"OCR reader is unavailable: {self.ocr_error()}")
+                item = self._scheduler.next_frame(timeout=0.5)
+                if item is None:
+                    continue
+                frame, result = item
+                with perf.stage("worker.frame"):
+                    index, buffer = self._handoff.acquire(frame.shape)
+                    _, texts = self._camera.annotate(frame, result, out=buffer)
+                    if self._handoff.commit(index, texts):
+                        self.frame_ready.emit()
         except Exception as e:
             self.error.emit(str(e))
         finally:
+            self._scheduler.stop()
             self._camera.close()
 
+    def is_ocr_ready(self) -> bool:
+        """
+        Checks whether the OCR model has finished loading in the background.
+        """
+        if self._ocr_service is not None:
+            return self._ocr_service.is_ready
+        if self._ocr_engine is not None:
+            return self._ocr_engine.is_ready
+        return self._camera.reader_ready and self._camera.reader is not None
+
+    def ocr_error(self) -> Optional[Exception]:
+        """
+        Returns the error that kept the OCR reader from loading, if any.
+        """
+        if self._ocr_service is not None:
+            return self._ocr_service.reader_error
+        if self._ocr_engine is not None:
+            return self._ocr_engine.reader_error
+        return self._camera.reader_error
+
+    def take_frame(self) -> Optional[Tuple[QImage, List[str]]]:
+        """
+        Returns the newest annotated frame and its texts, or None if there is no new frame.
+        Must be called from the UI thread; the image is only valid until the next call.
+        """
+        return self._handoff.take()
+
+    def set_target_ocr_fps(self, fps: float):
+        """
+        Sets the maximum number of OCR passes per second (0 runs OCR as fast as possible).
+        """
+        self._scheduler.target_ocr_fps = fps
+
+    def pipeline_stats(self) -> dict:
+        """
+        Returns capture, display and OCR frame counters, including dropped frames
+        and OCR passes skipped because the scene did not change.
+        """
+        stats = self._scheduler.stats()
+        inference = self._camera.inference_stats()
+        stats["ocr_executed"] = inference["executed"]
+        stats["ocr_skipped"] = inference["skipped"]
+        handoff = self._handoff.stats()
+        stats["frames_emitted"] = handoff["emitted"]
+        stats["frames_displayed"] = handoff["displayed"]
+        stats["frames_dropped"] = handoff["dropped"]
+        return stats
+
+    def start(self, *args, **kwargs):
+        """
+        Starts the OCR worker process (if enabled) and then the worker thread.
+        """
+        if self._ocr_engine is not None:
+            self._ocr_engine.start()
+        super().start(*args, **kwargs)
+
     def stop(self):
         """
-        Stops the worker thread.
+        Stops the worker thread and the OCR worker process.
         """
         self._is_running = False
         self.wait(1000)
+        if self._ocr_engine is not None:
+            self._ocr_engine.stop()
 
 
 class MainWindow(QMainWindow, Ui_MainWindow):
     """
     The main window of the application.
     """
-    def __init__(self, cam_index: int = 0, gpu: bool = True):
+    def __init__(
+        self,
+        cam_index: int = 0,
+        gpu: bool = True,
+        cam_indices: Optional[List[int]] = None,
+        use_process: bool = False,
+        backend: str = "default",
+        cpu_threads: Optional[int] = None,
+    ):
         super().__init__()
         self.setupUi(self)
 
         self.camera_view.setScaledContents(True)
+        self.cam_indices = list(cam_indices) if cam_indices else [cam_index]
 
         self.my_medicine_list_model = QStandardItemModel(self)
         self.my_medicines_list_view.setModel(self.my_medicine_list_model)
+        self.interactions = InteractionEngine()
+        self.my_medicine_list_model.rowsAboutToBeRemoved.connect(self.on_medicines_about_to_be_removed)
 
-        self.dur_table_model = QStandardItemModel(0, 3, self)
-        self.dur_table_model.setHorizontalHeaderLabels(
-            ["Ingredient", "Product Name", "Reason for Contraindication"]
-        )
+        self.dur_table_model = DURTableModel(self)
         self.dur_table_view.setModel(self.dur_table_model)
         self._configure_dur_table()
 
         self._latest_ocr_texts: List[str] = []
+        self._stable_text = StableTextTracker()
         self.api_key = self._load_api_key()
-        if self.api_key:
-            self.dur_client = DURClient(api_key=self.api_key)
+        # The offline index answers lookups on its own, so it is usable without an API key.
+        offline_index = DURIndex() if os.path.exists(DURIndex.DEFAULT_PATH) else None
+        if self.api_key or offline_index is not None:
+            # Building the matcher takes about a second for a full name list; until it is ready,
+            # lookups use the raw OCR text.
+            self.name_matcher = None
+            threading.Thread(
+                target=self._load_name_matcher, args=(offline_index,), name="name-matcher-loader", daemon=True
+            ).start()
+            self.dur_client = DURClient(api_key=self.api_key, cache=DURCache(), offline_index=offline_index)
+            self.dur_lookup = DURLookupService(self.dur_client, parent=self)
+            self.dur_lookup.items_ready.connect(self.on_dur_items_ready)
+            self.dur_lookup.finished.connect(self.on_dur_lookup_finished)
+            self.dur_lookup.failed.connect(self.on_dur_lookup_failed)
         else:
             self.dur_client = None
-            self.status_bar.showMessage("DUR Client could not be initialized.", 5000)
+            self.dur_lookup = None
+            self.name_matcher = None
+            self.statusbar.showMessage("DUR Client could not be initialized.", 5000)
 
-        self.ocr_worker = OCRWorker(cam_index=cam_index, gpu=gpu, parent=self)
-        self.ocr_worker.frame_ready.connect(self.on_frame_ready)
-        self.ocr_worker.error.connect(self.on_worker_error)
-        self.ocr_worker.start()
+        self._setup_camera_panes(gpu, use_process, backend, cpu_threads)
+        self.statusbar.showMessage("Loading OCR model...")
 
         self.add_medicine_button.clicked.connect(self.on_add_medicine_clicked)
         self.quit_button.clicked.connect(self.close)
 
+        self.perf_label = None
+        if perf.enabled:
+            self._setup_perf_overlay()
+
+    def _setup_camera_panes(
+        self, gpu: bool, use_process: bool = False, backend: str = "default", cpu_threads: Optional[int] = None
+    ):
+        """
+        Starts one OCR worker and preview pane per camera.
+        With several cameras, all workers share a single OCR service and model; with one camera,
+        `use_process` runs OCR in a separate worker process.
+        """
+        self.ocr_service = None
+        self.camera_views = [self.camera_view]
+        if len(self.cam_indices) > 1:
+            self.ocr_service = OCRService(gpu=gpu, backend=backend, cpu_threads=cpu_threads)
+            self.ocr_service.start()
+            self.verticalLayout.removeWidget(self.camera_view)
+            grid = QGridLayout()
+            grid.addWidget(self.camera_view, 0, 0)
+            for pane in range(1, len(self.cam_indices)):
+                view = QLabel(self.verticalLayoutWidget_2)
+                view.setScaledContents(True)
+                grid.addWidget(view, pane // 2, pane % 2)
+                self.camera_views.append(view)
+            self.verticalLayout.addLayout(grid)
+
+        self.ocr_workers: List[OCRWorker] = []
+        for pane, cam_index in enumerate(self.cam_indices):
+            worker = OCRWorker(
+                cam_index=cam_index, gpu=gpu, use_process=use_process, ocr_service=self.ocr_service,
+                backend=backend, cpu_threads=cpu_threads, parent=self,
+            )
+            worker.frame_ready.connect(partial(self.on_frame_ready, pane))
+            worker.error.connect(self.on_worker_error)
+            self.ocr_workers.append(worker)
+        self.ocr_worker = self.ocr_workers[0]
+        self.ocr_worker.ocr_ready.connect(self.on_ocr_ready)
+        self._active_pane = 0
+        for worker in self.ocr_workers:
+            worker.start()
+
+    def _setup_perf_overlay(self):
+        """
+        Shows the median latency of the main pipeline stages in the status bar.
+        """
+        self.perf_label = QLabel(self)
+        self.statusbar.addPermanentWidget(self.perf_label)
+        self._perf_timer = QTimer(self)
+        self._perf_timer.timeout.connect(self._update_perf_overlay)
+        self._perf_timer.start(1000)
+
+    def _update_perf_overlay(self):
+        """
+        Refreshes the performance overlay from the current stage histograms.
+        """
+        snapshot = perf.snapshot()
+        parts = [
+            f"{name} {snapshot[name]['p50']:.1f}ms"
+            for name in ("capture.read", "ocr.inference", "annotate", "ui.frame_delivery", "ui.on_frame_ready")
+            if "p50" in snapshot.get(name, {})
+        ]
+        stats = [worker.pipeline_stats() for worker in self.ocr_workers]
+        parts.append(
+            f"ocr {sum(s['ocr'] for s in stats)} / dropped {sum(s['frames_dropped'] for s in stats)}"
+        )
+        if self.ocr_service is not None:
+            service = self.ocr_service.stats()
+            parts.append(f"batches {service['batches']} / frames {service['frames']}")
+        self.perf_label.setText(" | ".join(parts))
+
     def _configure_dur_table(self):
         """
         Configures the appearance and behavior of the DUR table.
@@ -97,7 +314,26 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.dur_table_view.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.dur_table_view.horizontalHeader().setStretchLastSection(True)
         self.dur_table_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.dur_table_view.setSortingEnabled(False)
+        self.dur_table_view.setSortingEnabled(True)
+        self.dur_table_view.sortByColumn(-1, Qt.SortOrder.AscendingOrder)
+        self.dur_filter_edit.textChanged.connect(self.dur_table_model.set_filter)
+
+    def _load_name_matcher(self, offline_index: Optional[DURIndex]):
+        """
+        Builds the product-name matcher from product_names.txt and/or the offline DUR index.
+        Runs in a background thread and publishes the matcher through `self.name_matcher`.
+        """
+        try:
+            names = []
+            if os.path.exists("product_names.txt"):
+                with open("product_names.txt", "r", encoding="utf-8-sig") as f:
+                    names.extend(line.strip() for line in f if line.strip())
+            if offline_index is not None:
+                names.extend(offline_index.product_names())
+            if names:
+                self.name_matcher = DrugNameMatcher(names)
+        except Exception as e:
+            print(f"Failed to load the product name list. Error: {e}")
 
     def _load_api_key(self) -> str:
         """
@@ -108,29 +344,50 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 config = yaml.safe_load(f) or {}
             api_key = config.get("DECODING_KEY", "")
             if not api_key:
-                self.status_bar.showMessage("API key is missing from config.yaml.", 5000)
+                self.statusbar.showMessage("API key is missing from config.yaml.", 5000)
             return api_key
         except FileNotFoundError:
-            self.status_bar.showMessage("config.yaml not found.", 5000)
+            self.statusbar.showMessage("config.yaml not found.", 5000)
             return ""
 
-    @Slot(QImage, list)
-    def on_frame_ready(self, qt_image: QImage, texts: List[str]):
+    def on_frame_ready(self, pane: int = 0):
         """
-        Slot to handle a new frame from the OCR worker.
+        Slot to handle a new frame from the OCR worker of a camera pane.
+        The pane that most recently detected text drives the current OCR result.
         """
-        self.camera_view.setPixmap(QPixmap.fromImage(qt_image))
+        with perf.stage("ui.on_frame_ready"):
+            frame = self.ocr_workers[pane].take_frame()
+            if frame is None:
+                return
+            qt_image, texts = frame
+            self.camera_views[pane].setPixmap(QPixmap.fromImage(qt_image))
+        if texts:
+            self._active_pane = pane
+        elif pane != self._active_pane:
+            return
         self._latest_ocr_texts = texts or []
         self.ocr_result_label.setText(
             self._latest_ocr_texts[0] if self._latest_ocr_texts else "No text detected"
         )
 
+        if self.dur_lookup and self._stable_text.update(self._latest_ocr_texts):
+            item_name = self._resolve_item_name(self._latest_ocr_texts)
+            if item_name:
+                self.dur_lookup.prefetch(item_name)
+
+    @Slot()
+    def on_ocr_ready(self):
+        """
+        Slot called once the OCR model has been loaded in the background.
+        """
+        self.statusbar.showMessage("OCR model loaded.", 3000)
+
     @Slot(str)
     def on_worker_error(self, message: str):
         """
         Slot to handle an error from the OCR worker.
         """
-        self.status_bar.showMessage(f"Camera/OCR error: {message}", 5000)
+        self.statusbar.showMessage(f"Camera/OCR error: {message}", 5000)
 
     def on_add_medicine_clicked(self):
         """
@@ -138,87 +395,152 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         Adds the detected medicine to the list and checks for interactions.
         """
         if not self._latest_ocr_texts:
-            self.status_bar.showMessage("No text to add.", 2000)
+            self.statusbar.showMessage("No text to add.", 2000)
             return
 
-        item_name = (self._latest_ocr_texts[0] or "").strip()
+        item_name = self._resolve_item_name(self._latest_ocr_texts)
         if not item_name:
-            self.status_bar.showMessage("Cannot add empty text.", 2000)
+            self.statusbar.showMessage("Cannot add empty text.", 2000)
             return
 
         self.my_medicine_list_model.appendRow(QStandardItem(item_name))
+        new_conflicts = self.interactions.add_drug(item_name)
         self._check_for_drug_interactions(item_name)
+        if new_conflicts:
+            self._announce_conflicts(new_conflicts)
+
+    @Slot(QModelIndex, int, int)
+    def on_medicines_about_to_be_removed(self, parent: QModelIndex, first: int, last: int):
+        """
+        Keeps the interaction engine in sync when medicines are removed from the list.
+        """
+        for row in range(first, last + 1):
+            self.interactions.remove_drug(self.my_medicine_list_model.item(row).text())
+        QTimer.singleShot(0, self._refresh_conflict_highlights)
+
+    def _refresh_conflict_highlights(self):
+        """
+        Marks medicines that conflict with another medicine on the list.
+        """
+        for row in range(self.my_medicine_list_model.rowCount()):
+            item = self.my_medicine_list_model.item(row)
+            conflicts = self.interactions.conflicts_for(item.text())
+            if conflicts:
+                item.setForeground(QBrush(QColor(200, 0, 0)))
+                item.setToolTip("\n".join(
+                    f"{other}: {', '.join(reasons)}" for other, reasons in conflicts.items()
+                ))
+            else:
+                item.setForeground(QBrush())
+                item.setToolTip("")
+
+    def _resolve_item_name(self, texts: List[str]) -> str:
+        """
+        Maps the OCR texts of a frame to the item name used for DUR lookups.
+        """
+        item_name = (texts[0] or "").strip() if texts else ""
+        if item_name and self.name_matcher is not None:
+            match = self.name_matcher.best_of(texts)
+            if match is not None:
+                item_name = match[0]
+        return item_name
 
     def _check_for_drug_interactions(self, item_name: str):
         """
-        Queries the DUR API for interactions and populates the table.
+        Starts a background DUR lookup; result pages are added to the table as they arrive.
         """
-        if not self.dur_client:
-            self.status_bar.showMessage("DUR client is not available.", 5000)
+        if not self.dur_lookup:
+            self.statusbar.showMessage("DUR client is not available.", 5000)
             return
 
-        try:
-            response = self.dur_client.query_drug_interaction(item_name=item_name, rows=50)
-            rows_added = self._populate_dur_table_from_response(response.json())
-            if rows_added == 0:
-                self.status_bar.showMessage("No drug interaction results found.", 3000)
-            else:
-                self.dur_table_view.scrollToBottom()
-                self.status_bar.showMessage(f"Added {rows_added} DUR results.", 2000)
-        except Exception as e:
-            self.status_bar.showMessage(f"DUR API error: {e}", 5000)
+        # A prefetched lookup finishes inside `lookup`, so its result message must come after this one.
+        self.statusbar.showMessage(f"Looking up interactions for {item_name}...")
+        self.dur_lookup.lookup(item_name)
 
-    def _populate_dur_table_from_response(self, response_data: dict) -> int:
+    @Slot(str, list)
+    def on_dur_items_ready(self, item_name: str, items: List[dict]):
         """
-        Parses the DUR API JSON response and adds rows to the table.
+        Slot to add one page of DUR results to the table.
         """
-        items = self._extract_items_from_response(response_data)
-        if not items:
-            return 0
+        # New rows land at the bottom only while the table is unsorted.
+        if self._append_dur_rows(items) and self.dur_table_model.sort_column < 0:
+            self.dur_table_view.scrollToBottom()
 
-        added_count = 0
-        for item in items:
-            ingredient = str(item.get("MIXTURE_INGR_KOR_NAME", "") or "")
-            product_name = str(item.get("MIXTURE_ITEM_NAME", "") or "")
-            reason = str(item.get("PROHBT_CONTENT", "") or "")
+        new_conflicts = self.interactions.add_dur_items(item_name, items)
+        if new_conflicts:
+            self._announce_conflicts(new_conflicts)
 
-            if not (ingredient or product_name or reason):
-                continue
+    def _announce_conflicts(self, conflicts: List[Tuple[str, str, str]]):
+        """
+        Highlights conflicting medicines and shows the first new conflict in the status bar.
+        """
+        self._refresh_conflict_highlights()
+        drug, other, reason = conflicts[0]
+        self.statusbar.showMessage(f"Interaction: {drug} + {other} ({reason})", 10000)
 
-            self.dur_table_model.appendRow([
-                QStandardItem(ingredient),
-                QStandardItem(product_name),
-                QStandardItem(reason),
-            ])
-            added_count += 1
-        return added_count
+    @Slot(str, int)
+    def on_dur_lookup_finished(self, item_name: str, total: int):
+        """
+        Slot called once all DUR result pages for an item have been fetched.
+        A conflict of the item stays in the message, so it is not replaced by the row count.
+        """
+        conflicts = self.interactions.conflicts_for(item_name)
+        if conflicts:
+            other, reasons = next(iter(conflicts.items()))
+            self.statusbar.showMessage(
+                f"Interaction: {item_name} + {other} ({', '.join(reasons)}); {total} DUR results.", 10000
+            )
+        elif total == 0:
+            self.statusbar.showMessage("No drug interaction results found.", 3000)
+        else:
+            self.statusbar.showMessage(f"Added {total} DUR results for {item_name}.", 2000)
 
-    def _extract_items_from_response(self, response_data: dict) -> List[dict]:
+    @Slot(str, str)
+    def on_dur_lookup_failed(self, item_name: str, message: str):
         """
-        Safely extracts the list of items from the API response.
+        Slot to handle a failed DUR lookup.
         """
-        try:
-            items = response_data.get("body", {}).get("items", [])
-            if isinstance(items, dict):  # API can return a dict for a single item
-                items = items.get("item", [])
-            if isinstance(items, dict): # or a dict with a single item
-                return [items]
-            return items
-        except (AttributeError, TypeError):
-            return []
+        self.statusbar.showMessage(f"DUR API error: {message}", 5000)
 
+    def _append_dur_rows(self, items: List[dict]) -> int:
+        """
+        Adds DUR result items that are not in the table yet and returns the number of rows added.
+        """
+        if not items:
+            return 0
+        return self.dur_table_model.add_items(items)
 
     def closeEvent(self, event):
         """
         Handles the window close event to stop the worker thread.
         """
-        if self.ocr_worker.isRunning():
-            self.ocr_worker.stop()
+        for worker in self.ocr_workers:
+            if worker.isRunning():
+                worker.stop()
+        if self.ocr_service is not None:
+            self.ocr_service.stop()
+        if self.dur_client:
+            self.dur_client.close()
+        export_path = os.environ.get("MEDICINE_MANAGER_PERF_EXPORT")
+        if perf.enabled and export_path:
+            perf.export(export_path)
         event.accept()
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainWindow(cam_index=0, gpu=True)
+    parser = argparse.ArgumentParser(description="Medicine Manager")
+    parser.add_argument("--cameras", type=int, nargs="+", default=[0],
+                        help="Camera indices; several cameras share one OCR model.")
+    parser.add_argument("--ocr-process", action="store_true",
+                        help="Run OCR in a separate process (single camera only).")
+    parser.add_argument("--backend", choices=BACKENDS, default="default",
+                        help="Inference backend; use 'cpu' or 'cpu-onnx' on machines without a GPU.")
+    parser.add_argument("--cpu-threads", type=int, help="Intra-op threads of the CPU backends.")
+    args, qt_args = parser.parse_known_args()
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = MainWindow(
+        gpu=True, cam_indices=args.cameras, use_process=args.ocr_process,
+        backend=args.backend, cpu_threads=args.cpu_threads,
+    )
     window.setWindowTitle("Medicine Manager")
     window.show()
     sys.exit(app.exec())
@@ -1,10 +1,43 @@
-import os
-from typing import List, Tuple
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
 import cv2 as cv
-import easyocr
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+
+from annotation import AnnotationRenderer
+from change_detector import SceneChangeDetector
+from cpu_backend import BACKENDS, create_cpu_reader
+from detection_scale import AdaptiveScaleController
+from frame_source import CameraSource, FrameSource
+from perf import perf
+from roi_tracker import ROITracker
+
+if TYPE_CHECKING:
+    import easyocr
+
+
+def result_records(result: list) -> List[tuple]:
+    """Converts an EasyOCR result into small, plain-Python (box, text, prob) records."""
+    return [
+        ([[int(x), int(y)] for (x, y) in bbox], str(text), float(prob))
+        for (bbox, text, prob) in result
+    ]
+
+
+def group_by_shape(frames: List[np.ndarray]) -> List[List[int]]:
+    """Returns the indices of `frames` grouped by frame shape, for batched inference."""
+    groups = {}
+    for i, frame in enumerate(frames):
+        groups.setdefault(frame.shape, []).append(i)
+    return list(groups.values())
+
+
+def readtext_batch(reader: "easyocr.Reader", frames: List[np.ndarray]) -> List[list]:
+    """Runs same-sized frames through one `readtext_batched` call (or `readtext` for one frame)."""
+    if len(frames) > 1:
+        return reader.readtext_batched(frames)
+    return [reader.readtext(frames[0])]
 
 
 class OCRCamera:
@@ -14,88 +47,301 @@ class OCRCamera:
         self,
         languages: List[str] = ["ko"],
         gpu: bool = True,
-        cam_index: int = 0,
+        cam_index: Optional[int] = 0,
         font_path: str = "assets/NoonnuBasicGothicRegular.ttf",
         font_size: int = 32,
+        source: Optional[FrameSource] = None,
+        load_reader: bool = True,
+        background_load: bool = True,
+        skip_unchanged_frames: bool = True,
+        change_threshold: float = 6.0,
+        changed_area_threshold: float = 0.02,
+        ocr_mode: str = "full",
+        detection_interval: int = 15,
+        min_tracking_confidence: float = 0.3,
+        detection_scale_mode: str = "fixed",
+        detection_scale: float = 1.0,
+        latency_target_ms: float = 150.0,
+        backend: str = "default",
+        cpu_threads: Optional[int] = None,
     ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown inference backend: {backend}")
         self.languages = languages
         self.gpu = gpu
+        # "cpu" and "cpu-onnx" ignore `gpu` and run a thread-limited CPU reader.
+        self.backend = backend
+        self.cpu_threads = cpu_threads
         self.cam_index = cam_index
         self.font_path = font_path
         self.font_size = font_size
 
-        self.reader = self._initialize_reader()
-        self.cap = self._initialize_camera()
-        self.font = self._load_font()
+        # Without a reader, OCR is delegated to `inference_backend`. Frames come from `source`
+        # if given, otherwise from camera `cam_index`; with neither, frames are passed in
+        # directly (e.g. by an out-of-process OCR engine).
+        # The reader is loaded in the background by default so that the camera preview
+        # can start right away; OCR results begin once it is ready.
+        self.reader: Optional["easyocr.Reader"] = None
+        self.reader_error: Optional[Exception] = None
+        self._reader_ready = threading.Event()
+        if load_reader:
+            if background_load:
+                threading.Thread(target=self._load_reader, name="ocr-reader-loader", daemon=True).start()
+            else:
+                self._load_reader()
+        if source is not None:
+            self.cap = source
+        else:
+            self.cap = self._initialize_camera() if cam_index is not None else None
+        self.renderer = AnnotationRenderer(font_path, font_size=font_size)
         self.last_result = []
+        self.inference_backend: Optional[Callable[[np.ndarray], Optional[list]]] = None
+
+        self.change_detector = (
+            SceneChangeDetector(mean_threshold=change_threshold, area_threshold=changed_area_threshold)
+            if skip_unchanged_frames else None
+        )
+        self.inference_count = 0
+        self.skipped_inference_count = 0
+
+        if ocr_mode not in ("full", "tracking"):
+            raise ValueError(f"Unknown OCR mode: {ocr_mode}")
+        self.ocr_mode = ocr_mode
+        self.detection_interval = detection_interval
+        self.min_tracking_confidence = min_tracking_confidence
+        self.roi_tracker = ROITracker()
+        self.detection_count = 0
+        self._frames_since_detection = 0
+
+        if detection_scale_mode not in ("fixed", "adaptive"):
+            raise ValueError(f"Unknown detection scale mode: {detection_scale_mode}")
+        self.detection_scale = detection_scale
+        self.scale_controller = (
+            AdaptiveScaleController(target_ms=latency_target_ms, initial_scale=detection_scale)
+            if detection_scale_mode == "adaptive" else None
+        )
+
+    @property
+    def reader_ready(self) -> bool:
+        return self._reader_ready.is_set()
 
-    def _initialize_reader(self) -> easyocr.Reader:
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the reader has been loaded (or failed to load)."""
+        return self._reader_ready.wait(timeout)
+
+    def _load_reader(self):
+        """Loads the EasyOCR reader and runs a warm-up pass on a blank image."""
+        try:
+            reader = self._initialize_reader()
+            reader.readtext(np.zeros((64, 256, 3), dtype=np.uint8))
+            self.reader = reader
+        except Exception as e:
+            print(f"Failed to load the EasyOCR reader. Error: {e}")
+            self.reader_error = e
+        finally:
+            self._reader_ready.set()
+
+    def _initialize_reader(self) -> "easyocr.Reader":
         """Initializes the EasyOCR reader, with a fallback to CPU if GPU fails."""
+        if self.backend != "default":
+            return create_cpu_reader(self.languages, self.backend, self.cpu_threads)
+
+        import easyocr
+
+        gpu = self.gpu
+        if gpu:
+            try:
+                import torch
+                gpu = torch.cuda.is_available()
+            except ImportError:
+                gpu = False
+            if not gpu:
+                print("No CUDA device available, initializing EasyOCR on CPU.")
         try:
-            return easyocr.Reader(self.languages, gpu=self.gpu)
+            return easyocr.Reader(self.languages, gpu=gpu)
         except Exception as e:
+            if not gpu:
+                raise
             print(f"Failed to initialize EasyOCR with GPU, falling back to CPU. Error: {e}")
             return easyocr.Reader(self.languages, gpu=False)
 
-    def _initialize_camera(self) -> cv.VideoCapture:
+    def _initialize_camera(self) -> FrameSource:
         """Initializes the camera capture."""
-        cap = cv.VideoCapture(self.cam_index, cv.CAP_DSHOW if os.name == "nt" else 0)
-        if not cap.isOpened():
-            raise RuntimeError("Cannot open camera")
-        return cap
+        return CameraSource(self.cam_index)
 
-    def _load_font(self) -> ImageFont.FreeTypeFont:
-        """Loads the specified font, with a fallback to the default font."""
-        try:
-            return ImageFont.truetype(self.font_path, self.font_size)
-        except IOError:
-            print(f"Could not load font from {self.font_path}, falling back to default font.")
-            return ImageFont.load_default()
+    def read_frame(self) -> np.ndarray:
+        """Reads a single frame from the camera or frame source."""
+        with perf.stage("capture.read"):
+            ok, frame = self.cap.read()
+        if not ok:
+            raise RuntimeError("Failed to read frame from camera")
+        return frame
 
     def read_and_annotate(self) -> Tuple[np.ndarray, List[str]]:
         """
         Reads a frame, performs OCR, and returns the annotated frame and recognized texts.
         This method displays the annotated frame in a separate window.
         """
-        ok, frame = self.cap.read()
-        if not ok:
-            raise RuntimeError("Failed to read frame from camera")
+        frame = self.read_frame()
 
         annotated_frame, texts = self.process_frame(frame)
         cv.imshow("OCR Result", annotated_frame)
         return annotated_frame, texts
 
+    def read_and_recognize(self) -> Tuple[np.ndarray, list]:
+        """
+        Reads a frame and returns it untouched together with the raw OCR result.
+        Headless users can call this to skip annotation entirely.
+        """
+        frame = self.read_frame()
+        return frame, self.recognize(frame)
+
+    @staticmethod
+    def texts_from_result(result: list) -> List[str]:
+        """Returns the recognized texts of an EasyOCR result."""
+        return [text for (_, text, _) in result]
+
     def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, List[str]]:
         """Performs OCR on a frame and annotates it with bounding boxes and text."""
-        result = self.reader.readtext(frame)
+        result = self.recognize(frame)
+        return self.annotate(frame, result)
+
+    def recognize(self, frame: np.ndarray) -> list:
+        """
+        Runs OCR on a frame and returns the raw EasyOCR result.
+        If the scene has not changed since the last OCR pass, the last result is reused.
+        """
+        if self.change_detector is not None:
+            with perf.stage("ocr.change_detection"):
+                changed = self.change_detector.has_changed(frame)
+            if not changed:
+                self.skipped_inference_count += 1
+                return self.last_result
+            self.change_detector.update_reference(frame)
+
+        with perf.stage("ocr.inference"):
+            if self.inference_backend is not None:
+                result = self.inference_backend(frame)
+            elif self.reader is None:
+                # Still loading, or failed to load (see `reader_error`): frames pass through without OCR.
+                result = None
+            elif self.ocr_mode == "tracking":
+                result = self._run_tracked_ocr(frame)
+            else:
+                result = self._run_full_ocr(frame)
+
+        if result is None:
+            # OCR is not ready yet; make sure the frame is retried later.
+            if self.change_detector is not None:
+                self.change_detector.reset()
+            return self.last_result
+        self.inference_count += 1
         self.last_result = result
+        return result
 
-        img_pil = Image.fromarray(cv.cvtColor(frame, cv.COLOR_BGR2RGB))
-        draw = ImageDraw.Draw(img_pil)
-        texts: List[str] = []
+    def _run_full_ocr(self, frame: np.ndarray) -> list:
+        """
+        Runs EasyOCR detection and recognition over the whole frame.
+        Below scale 1.0, detection runs on a downscaled copy and recognition on full-resolution crops.
+        """
+        self.detection_count += 1
+        started = time.monotonic()
+        if self.detection_scale >= 1.0:
+            with perf.stage("ocr.readtext"):
+                result = self.reader.readtext(frame)
+        else:
+            result = self._run_multiscale_ocr(frame, self.detection_scale)
 
-        for (bbox, text, prob) in result:
-            texts.append(text)
-            top_left = tuple(map(int, bbox[0]))
-            label_pos = (top_left[0], max(0, top_left[1] - self.font_size - 5))
-            draw.text(label_pos, text, font=self.font, fill=(255, 0, 0, 255))
+        if self.scale_controller is not None:
+            self.detection_scale = self.scale_controller.update((time.monotonic() - started) * 1000.0)
+        return result
 
-        annotated_frame_pil = np.array(img_pil)
-        annotated_frame_bgr = cv.cvtColor(annotated_frame_pil, cv.COLOR_RGB2BGR)
+    def _run_multiscale_ocr(self, frame: np.ndarray, scale: float) -> list:
+        """Detects text on a downscaled frame and recognizes it on the full-resolution frame."""
+        small = cv.resize(frame, None, fx=scale, fy=scale, interpolation=cv.INTER_AREA)
+        with perf.stage("ocr.detect"):
+            horizontal_list, free_list = self.reader.detect(small, min_size=max(4, int(20 * scale)))
+        horizontal_list, free_list = horizontal_list[0], free_list[0]
+        if not horizontal_list and not free_list:
+            return []
 
-        for (bbox, text, prob) in result:
-            top_left = tuple(map(int, bbox[0]))
-            bottom_right = tuple(map(int, bbox[2]))
-            cv.rectangle(annotated_frame_bgr, top_left, bottom_right, (0, 255, 0), 2)
+        horizontal_list = [[int(round(v / scale)) for v in box] for box in horizontal_list]
+        free_list = [[[int(round(x / scale)), int(round(y / scale))] for (x, y) in box] for box in free_list]
+        grey = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        with perf.stage("ocr.recognize_boxes"):
+            return self.reader.recognize(grey, horizontal_list=horizontal_list, free_list=free_list, detail=1)
 
-        return annotated_frame_bgr, texts
+    def _run_tracked_ocr(self, frame: np.ndarray) -> list:
+        """
+        Runs full detection periodically or when tracking is lost, and in between only
+        recognizes text inside the boxes tracked from the previous result.
+        """
+        grey = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        boxes = None
+        if self.last_result and self._frames_since_detection < self.detection_interval:
+            boxes = self.roi_tracker.track(grey)
+
+        if boxes is not None:
+            result = self._recognize_boxes(grey, boxes)
+            confidences = [prob for (_, _, prob) in result]
+            if confidences and sum(confidences) / len(confidences) >= self.min_tracking_confidence:
+                self._frames_since_detection += 1
+                return result
+
+        result = self._run_full_ocr(frame)
+        self._frames_since_detection = 0
+        self.roi_tracker.reset(grey, [bbox for (bbox, _, _) in result])
+        return result
+
+    def _recognize_boxes(self, grey: np.ndarray, boxes: list) -> list:
+        """Runs only the EasyOCR recognition step on the given 4-point boxes."""
+        h, w = grey.shape[:2]
+        horizontal_list = []
+        for box in boxes:
+            x_min = int(max(0, np.floor(box[:, 0].min())))
+            x_max = int(min(w, np.ceil(box[:, 0].max())))
+            y_min = int(max(0, np.floor(box[:, 1].min())))
+            y_max = int(min(h, np.ceil(box[:, 1].max())))
+            if x_max > x_min and y_max > y_min:
+                horizontal_list.append([x_min, x_max, y_min, y_max])
+        if not horizontal_list:
+            return []
+        with perf.stage("ocr.recognize_boxes"):
+            return self.reader.recognize(grey, horizontal_list=horizontal_list, free_list=[], detail=1)
+
+    def inference_stats(self) -> dict:
+        """Returns the number of executed and skipped OCR passes."""
+        return {
+            "executed": self.inference_count,
+            "skipped": self.skipped_inference_count,
+            "detections": self.detection_count,
+            "detection_scale": self.detection_scale,
+        }
+
+    def annotate(
+        self, frame: np.ndarray, result: list, out: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, List[str]]:
+        """
+        Draws an OCR result onto a frame and returns the annotated frame and its texts.
+        The result does not have to come from the same frame, which lets a live frame
+        be drawn with the most recent boxes while OCR runs at a lower rate.
+        If `out` is given, the frame is copied into it and annotated there.
+        """
+        with perf.stage("annotate"):
+            if out is None:
+                return self.renderer.draw(frame, result), self.texts_from_result(result)
+            np.copyto(out, frame)
+            return self.renderer.draw(out, result, copy=False), self.texts_from_result(result)
 
 
     def close(self):
         """Releases the camera and destroys all OpenCV windows."""
-        if self.cap.isOpened():
+        if self.cap is not None and self.cap.isOpened():
             self.cap.release()
-        cv.destroyAllWindows()
+        try:
+            cv.destroyAllWindows()
+        except cv.error:
+            pass  # Headless OpenCV builds have no highgui.
 
 
 class UIOCRCamera(OCRCamera):
@@ -108,8 +354,5 @@ class UIOCRCamera(OCRCamera):
         Reads a frame, performs OCR, and returns the annotated frame and recognized texts
         without displaying a window.
         """
-        ok, frame = self.cap.read()
-        if not ok:
-            raise RuntimeError("Failed to read frame from camera")
-
+        frame = self.read_frame()
         return self.process_frame(frame)
@@ -0,0 +1,242 @@
+import multiprocessing as mp
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+def _ocr_process_main(requests, results, camera_kwargs: dict):
+    """
+    Entry point of the OCR worker process.
+    Owns the EasyOCR reader and answers frame requests read from the shared-memory ring.
+    Each request names its segment, so the parent can replace the ring with a larger one.
+    """
+    from ocr import OCRCamera, result_records
+
+    shm = None
+    try:
+        camera = OCRCamera(
+            cam_index=None, skip_unchanged_frames=False, background_load=False, **camera_kwargs
+        )
+        if camera.reader is None:
+            results.put(("failed", str(camera.reader_error)))
+            return
+        results.put(("ready",))
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            seq, shm_name, offset, shape = request
+            if shm is None or shm.name != shm_name:
+                if shm is not None:
+                    shm.close()
+                # Spawned children share the parent's resource tracker, which keeps a set of
+                # names, so attaching does not need any tracker bookkeeping.
+                shm = shared_memory.SharedMemory(name=shm_name)
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=offset)
+            try:
+                records = result_records(camera.recognize(frame))
+                results.put(("result", seq, records))
+            except Exception as e:
+                results.put(("error", seq, str(e)))
+            del frame
+    finally:
+        if shm is not None:
+            shm.close()
+
+
+class SharedFrameRing:
+    """
+    A fixed set of frame-sized slots in a shared-memory segment.
+    Frames are copied into the next slot and only the (slot, shape) pair crosses the process boundary.
+    """
+    def __init__(self, slots: int = 2, frame_shape: Tuple[int, ...] = (1080, 1920, 3)):
+        self.slots = slots
+        self.slot_bytes = int(np.prod(frame_shape))
+        self.shm = shared_memory.SharedMemory(create=True, size=self.slot_bytes * slots)
+        self._next_slot = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def write(self, frame: np.ndarray) -> Tuple[int, Tuple[int, ...]]:
+        """Copies a frame into the next slot and returns (byte offset, shape)."""
+        if frame.dtype != np.uint8 or frame.nbytes > self.slot_bytes:
+            raise ValueError(
+                f"Frame {frame.shape} {frame.dtype} does not fit into a {self.slot_bytes}-byte uint8 slot."
+            )
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.slots
+        view = np.ndarray(frame.shape, dtype=np.uint8, buffer=self.shm.buf, offset=slot * self.slot_bytes)
+        view[...] = frame
+        del view
+        return slot * self.slot_bytes, frame.shape
+
+    def close(self):
+        """Closes and unlinks the shared-memory segment."""
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class OCRProcessEngine:
+    """
+    Runs OCR in a separate worker process that owns the EasyOCR reader.
+
+    Keeping PyTorch inference out of the UI interpreter means it no longer competes with the
+    Qt thread for the GIL. Frames travel through a `SharedFrameRing` that is sized from the
+    first frame and grown if a larger one arrives; results come back as compact records.
+    If the worker process dies, it is restarted with an exponential backoff; after
+    `max_restarts` consecutive restarts without a result, `recognize` raises.
+    `recognize` returns None while the worker is still loading its model.
+    """
+    def __init__(
+        self,
+        camera_kwargs: Optional[dict] = None,
+        slots: int = 2,
+        result_timeout: float = 10.0,
+        max_restarts: int = 3,
+        restart_backoff: float = 1.0,
+    ):
+        self.camera_kwargs = camera_kwargs or {}
+        self.slots = slots
+        self.result_timeout = result_timeout
+        self.max_restarts = max_restarts
+        self.restart_backoff = restart_backoff
+        self.restart_count = 0
+        self._failed_restarts = 0
+        self._next_restart = 0.0
+        self._started = False
+
+        self._ctx = mp.get_context("spawn")
+        self._ring: Optional[SharedFrameRing] = None
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._ready = False
+        self._seq = 0
+        self.reader_error: Optional[str] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        """Starts the worker process; the frame ring is allocated with the first frame."""
+        self._started = True
+        self._failed_restarts = 0
+        self._spawn()
+
+    def _spawn(self):
+        self._requests = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._ready = False
+        self._process = self._ctx.Process(
+            target=_ocr_process_main,
+            args=(self._requests, self._results, self.camera_kwargs),
+            name="ocr-engine",
+            daemon=True,
+        )
+        self._process.start()
+
+    def _restart(self) -> bool:
+        """
+        Restarts a dead worker process unless the engine has been stopped or is still backing
+        off from the last restart. Returns True if a new process was started.
+        """
+        if not self._started:
+            return False
+        if self._failed_restarts >= self.max_restarts:
+            raise RuntimeError(
+                f"OCR worker process keeps exiting; gave up after {self._failed_restarts} restarts."
+            )
+        now = time.monotonic()
+        if now < self._next_restart:
+            return False
+        print("OCR worker process exited unexpectedly, restarting it.")
+        self._terminate()
+        self.restart_count += 1
+        self._failed_restarts += 1
+        self._next_restart = now + self.restart_backoff * 2 ** (self._failed_restarts - 1)
+        self._spawn()
+        return True
+
+    def _terminate(self, timeout: float = 2.0):
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            try:
+                self._requests.put(None)
+            except (OSError, ValueError):
+                pass
+            self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout)
+        self._process = None
+
+    def stop(self):
+        """Stops the worker process and releases the shared memory."""
+        self._started = False
+        self._terminate()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def _wait_ready(self, timeout: float) -> bool:
+        try:
+            message = self._results.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        if message[0] == "failed":
+            self.reader_error = message[1]
+        self._ready = message[0] == "ready"
+        return self._ready
+
+    def recognize(self, frame: np.ndarray) -> Optional[List[tuple]]:
+        """
+        Sends a frame to the worker process and waits for its OCR records.
+        Returns None while the worker is (re)loading its model, after a timeout, or if the
+        worker could not load its model (see `reader_error`).
+        """
+        if not self._started:
+            raise RuntimeError("The OCR process engine has not been started.")
+        if self.reader_error is not None:
+            return None
+        if not self.is_running and not self._restart():
+            return None
+        if not self._ready and not self._wait_ready(timeout=0.5):
+            return None
+
+        if self._ring is None or frame.nbytes > self._ring.slot_bytes:
+            # Size the ring from the actual frames; the worker attaches to the new segment by name.
+            if self._ring is not None:
+                self._ring.close()
+            self._ring = SharedFrameRing(self.slots, frame.shape)
+        self._seq += 1
+        offset, shape = self._ring.write(frame)
+        self._requests.put((self._seq, self._ring.name, offset, shape))
+
+        while True:
+            try:
+                message = self._results.get(timeout=self.result_timeout)
+            except queue.Empty:
+                if not self.is_running:
+                    self._restart()
+                return None
+            kind, seq = message[0], message[1]
+            if seq != self._seq:
+                continue
+            if kind == "error":
+                raise RuntimeError(f"OCR worker process error: {message[2]}")
+            self._failed_restarts = 0
+            return message[2]
@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ocr import OCRCamera, group_by_shape, readtext_batch
+from perf import perf
+
+
+class OCRService:
+    """
+    A single EasyOCR reader shared by any number of capture sources.
+
+    Workers hand frames to `recognize`, which blocks until the result is ready. The service
+    thread waits up to `batch_window_ms` after the first pending frame for more frames to
+    arrive, then runs same-sized frames through one `readtext_batched` call and routes each
+    result back to the worker that submitted it. One model in memory serves every camera.
+    """
+    def __init__(
+        self,
+        languages: Optional[List[str]] = None,
+        gpu: bool = True,
+        batch_window_ms: float = 20.0,
+        max_batch: int = 8,
+        backend: str = "default",
+        cpu_threads: Optional[int] = None,
+    ):
+        self.batch_window_ms = batch_window_ms
+        self.max_batch = max_batch
+        self._engine = OCRCamera(
+            languages=languages or ["ko", "en"], gpu=gpu, cam_index=None, skip_unchanged_frames=False,
+            backend=backend, cpu_threads=cpu_threads,
+        )
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[np.ndarray, Future]] = []
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.batch_count = 0
+        self.frame_count = 0
+
+    @property
+    def is_ready(self) -> bool:
+        return self._engine.reader is not None
+
+    @property
+    def reader_error(self) -> Optional[Exception]:
+        """The error that kept the shared reader from loading, if any."""
+        return self._engine.reader_error
+
+    def start(self):
+        """Starts the batching thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="ocr-service", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Stops the batching thread and cancels frames that are still pending."""
+        with self._cond:
+            self._running = False
+            pending, self._pending = self._pending, []
+            self._cond.notify_all()
+        for _, future in pending:
+            future.cancel()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, frame: np.ndarray) -> Future:
+        """Queues a frame for the next batch and returns a future of its OCR result."""
+        future = Future()
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("The OCR service is not running.")
+            self._pending.append((frame, future))
+            self._cond.notify_all()
+        return future
+
+    def recognize(self, frame: np.ndarray) -> Optional[list]:
+        """
+        Returns the OCR result of a frame, or None while the shared reader is still loading
+        (or if it failed to load). Usable as an OCRCamera `inference_backend`.
+        """
+        if not self.is_ready:
+            return None
+        return self.submit(frame).result()
+
+    def stats(self) -> dict:
+        """Returns the number of batches run and frames processed."""
+        return {"batches": self.batch_count, "frames": self.frame_count}
+
+    def _next_batch(self) -> List[Tuple[np.ndarray, Future]]:
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending or not self._running)
+            if not self._running:
+                return []
+            deadline = time.monotonic() + self.batch_window_ms / 1000.0
+            while len(self._pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    break
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+        return [(frame, future) for frame, future in batch if future.set_running_or_notify_cancel()]
+
+    def _serve(self):
+        while self._running:
+            batch = self._next_batch()
+            if not batch:
+                continue
+            for indices in group_by_shape([frame for frame, _ in batch]):
+                group = [batch[i] for i in indices]
+                try:
+                    with perf.stage("ocr.service_batch"):
+                        results = readtext_batch(self._engine.reader, [frame for frame, _ in group])
+                except Exception as e:
+                    for _, future in group:
+                        future.set_exception(e)
+                    continue
+                for (_, future), result in zip(group, results):
+                    future.set_result(result)
+            self.batch_count += 1
+            self.frame_count += len(batch)
@@ -0,0 +1,129 @@
+import csv
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List
+
+
+class _NullStage:
+    """The context manager handed out while instrumentation is disabled; does nothing."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Returns a linearly interpolated percentile of already sorted values."""
+    position = (len(sorted_values) - 1) * percent / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class _StageTimer:
+    __slots__ = ("_recorder", "_name", "_started")
+
+    def __init__(self, recorder: "PerfRecorder", name: str):
+        self._recorder = recorder
+        self._name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._recorder.record(self._name, (time.perf_counter() - self._started) * 1000.0)
+        return False
+
+
+class StageHistogram:
+    """A rolling window of the most recent latency samples of one stage, in milliseconds."""
+
+    def __init__(self, window: int = 512):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def add(self, ms: float):
+        self.samples.append(ms)
+        self.count += 1
+        self.total_ms += ms
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {"count": self.count}
+        values = sorted(self.samples)
+        return {
+            "count": self.count,
+            "mean": sum(values) / len(values),
+            "p50": _percentile(values, 50),
+            "p90": _percentile(values, 90),
+            "p99": _percentile(values, 99),
+            "max": values[-1],
+        }
+
+
+class PerfRecorder:
+    """
+    Collects per-stage latency histograms for the hot path.
+
+    Wrap a stage in `with perf.stage("name"):` or report a measured duration with
+    `perf.record`. While disabled, `stage` returns a shared no-op context manager and
+    `record` returns immediately, so instrumentation can stay in place permanently.
+    """
+    def __init__(self, enabled: bool = False, window: int = 512):
+        self.enabled = enabled
+        self.window = window
+        self._lock = threading.Lock()
+        self._stages: Dict[str, StageHistogram] = {}
+
+    def stage(self, name: str):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _StageTimer(self, name)
+
+    def record(self, name: str, ms: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._stages.get(name)
+            if histogram is None:
+                histogram = self._stages[name] = StageHistogram(self.window)
+            histogram.add(ms)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Returns a summary (count, mean, percentiles, max) for every stage."""
+        with self._lock:
+            histograms = dict(self._stages)
+        return {name: histogram.summary() for name, histogram in sorted(histograms.items())}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def export(self, path: str):
+        """Writes the current snapshot as JSON, or as CSV if the path ends with .csv."""
+        snapshot = self.snapshot()
+        if path.lower().endswith(".csv"):
+            columns = ["stage", "count", "mean", "p50", "p90", "p99", "max"]
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                for name, summary in snapshot.items():
+                    writer.writerow({"stage": name, **summary})
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"exported_at": time.time(), "stages": snapshot}, f, indent=2)
+
+
+# The process-wide recorder. Set MEDICINE_MANAGER_PERF=1 to enable it at startup.
+perf = PerfRecorder(enabled=os.environ.get("MEDICINE_MANAGER_PERF", "") == "1")
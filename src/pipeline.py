@@ -0,0 +1,171 @@
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+class LatestFrameSlot:
+    """
+    A single-slot buffer that only ever holds the most recent frame.
+    Writers never block; a frame that is replaced before a reader gets to it is dropped.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._frame: Optional[np.ndarray] = None
+        self._seq = 0
+        self._closed = False
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def put(self, frame: np.ndarray):
+        """Replaces the stored frame and wakes up any waiting readers."""
+        with self._cond:
+            self._frame = frame
+            self._seq += 1
+            self._cond.notify_all()
+
+    def wait_newer(self, last_seq: int, timeout: Optional[float] = None) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Waits for a frame newer than `last_seq` and returns (seq, frame),
+        or None if the timeout expires or the slot is closed.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq > last_seq or self._closed, timeout)
+            if self._closed or self._seq <= last_seq:
+                return None
+            return self._seq, self._frame
+
+    def close(self):
+        """Wakes up all readers and makes further waits return immediately."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class FrameScheduler:
+    """
+    Runs camera capture and OCR inference as two decoupled stages.
+
+    The capture stage reads frames as fast as the camera delivers them and keeps only
+    the latest one. The inference stage pulls the latest frame at most `target_ocr_fps`
+    times per second (as fast as it can when the value is 0 or None) and publishes its
+    result. Display consumers call `next_frame` to get every new live frame together
+    with the most recent OCR result; frames that nobody picked up in time are dropped.
+    """
+    def __init__(
+        self,
+        read_frame: Callable[[], np.ndarray],
+        recognize: Callable[[np.ndarray], list],
+        target_ocr_fps: Optional[float] = 5.0,
+    ):
+        self._read_frame = read_frame
+        self._recognize = recognize
+        self.target_ocr_fps = target_ocr_fps
+
+        self._slot = LatestFrameSlot()
+        self._stop_event = threading.Event()
+        self._threads = []
+        self._error: Optional[BaseException] = None
+
+        self._result_lock = threading.Lock()
+        self._latest_result: list = []
+
+        self._display_seq = 0
+        self.captured_frames = 0
+        self.displayed_frames = 0
+        self.display_dropped_frames = 0
+        self.ocr_frames = 0
+        self.ocr_dropped_frames = 0
+
+    @property
+    def latest_result(self) -> list:
+        with self._result_lock:
+            return self._latest_result
+
+    def start(self):
+        """Starts the capture and inference threads."""
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="ocr-capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="ocr-inference", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Signals both stages to stop and waits briefly for them to finish."""
+        self._stop_event.set()
+        self._slot.close()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def next_frame(self, timeout: Optional[float] = None) -> Optional[Tuple[np.ndarray, list]]:
+        """
+        Returns the newest captured frame and the latest OCR result, or None on timeout.
+        Re-raises any error that stopped the capture or inference stage.
+        """
+        if self._error is not None:
+            raise self._error
+        item = self._slot.wait_newer(self._display_seq, timeout)
+        if item is None:
+            if self._error is not None:
+                raise self._error
+            return None
+
+        seq, frame = item
+        self.display_dropped_frames += seq - self._display_seq - 1
+        self._display_seq = seq
+        self.displayed_frames += 1
+        return frame, self.latest_result
+
+    def stats(self) -> dict:
+        """Returns the frame counters of all stages."""
+        return {
+            "captured": self.captured_frames,
+            "displayed": self.displayed_frames,
+            "display_dropped": self.display_dropped_frames,
+            "ocr": self.ocr_frames,
+            "ocr_dropped": self.ocr_dropped_frames,
+        }
+
+    def _capture_loop(self):
+        try:
+            while not self._stop_event.is_set():
+                frame = self._read_frame()
+                self._slot.put(frame)
+                self.captured_frames += 1
+        except Exception as e:
+            self._fail(e)
+
+    def _inference_loop(self):
+        last_seq = 0
+        try:
+            while not self._stop_event.is_set():
+                item = self._slot.wait_newer(last_seq, timeout=0.5)
+                if item is None:
+                    continue
+                seq, frame = item
+                self.ocr_dropped_frames += seq - last_seq - 1
+                last_seq = seq
+
+                started = time.monotonic()
+                result = self._recognize(frame)
+                with self._result_lock:
+                    self._latest_result = result
+                self.ocr_frames += 1
+
+                if self.target_ocr_fps:
+                    remaining = 1.0 / self.target_ocr_fps - (time.monotonic() - started)
+                    if remaining > 0:
+                        self._stop_event.wait(remaining)
+        except Exception as e:
+            self._fail(e)
+
+    def _fail(self, error: BaseException):
+        self._error = error
+        self._stop_event.set()
+        self._slot.close()
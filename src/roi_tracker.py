@@ -0,0 +1,71 @@
+from typing import List, Optional
+
+import cv2 as cv
+import numpy as np
+
+
+class ROITracker:
+    """
+    Tracks OCR text boxes across frames.
+
+    A label held in front of the camera mostly shifts as a whole, so the tracker estimates
+    the global translation between consecutive grayscale frames with phase correlation on
+    a downscaled copy and moves every box by the same offset. Tracking is reported as lost
+    when the correlation peak is weak, the shift is implausibly large, or a box leaves the
+    frame; the caller is then expected to run a full detection pass again.
+    """
+    def __init__(
+        self,
+        scale: float = 0.25,
+        min_response: float = 0.1,
+        max_shift_fraction: float = 0.2,
+    ):
+        self.scale = scale
+        self.min_response = min_response
+        self.max_shift_fraction = max_shift_fraction
+        self._reference: Optional[np.ndarray] = None
+        self._window: Optional[np.ndarray] = None
+        self._boxes: List[np.ndarray] = []
+
+    @property
+    def boxes(self) -> List[np.ndarray]:
+        return self._boxes
+
+    def _prepare(self, grey: np.ndarray) -> np.ndarray:
+        small = cv.resize(grey, None, fx=self.scale, fy=self.scale, interpolation=cv.INTER_AREA)
+        small = small.astype(np.float32)
+        if self._window is None or self._window.shape != small.shape:
+            self._window = cv.createHanningWindow((small.shape[1], small.shape[0]), cv.CV_32F)
+        return small
+
+    def reset(self, grey: np.ndarray, boxes: list):
+        """Starts tracking the given 4-point boxes from a freshly detected grayscale frame."""
+        self._reference = self._prepare(grey)
+        self._boxes = [np.asarray(box, dtype=np.float32) for box in boxes]
+
+    def track(self, grey: np.ndarray) -> Optional[List[np.ndarray]]:
+        """
+        Moves the tracked boxes to their position in the new grayscale frame.
+        Returns the updated boxes, or None when tracking has been lost.
+        """
+        if self._reference is None or not self._boxes:
+            return None
+
+        current = self._prepare(grey)
+        (dx, dy), response = cv.phaseCorrelate(self._reference, current, self._window)
+        if response < self.min_response:
+            return None
+
+        dx, dy = dx / self.scale, dy / self.scale
+        h, w = grey.shape[:2]
+        if abs(dx) > w * self.max_shift_fraction or abs(dy) > h * self.max_shift_fraction:
+            return None
+
+        moved = [box + np.array([dx, dy], dtype=np.float32) for box in self._boxes]
+        for box in moved:
+            if box[:, 0].max() < 0 or box[:, 1].max() < 0 or box[:, 0].min() >= w or box[:, 1].min() >= h:
+                return None
+
+        self._reference = current
+        self._boxes = moved
+        return moved
@@ -16,10 +16,10 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
     QIcon, QImage, QKeySequence, QLinearGradient,
     QPainter, QPalette, QPixmap, QRadialGradient,
     QTransform)
-from PySide6.QtWidgets import (QApplication, QHeaderView, QLabel, QListView,
-    QMainWindow, QMenu, QMenuBar, QPushButton,
-    QScrollArea, QSizePolicy, QStatusBar, QTableView,
-    QVBoxLayout, QWidget)
+from PySide6.QtWidgets import (QApplication, QHeaderView, QLabel, QLineEdit,
+    QListView, QMainWindow, QMenu, QMenuBar,
+    QPushButton, QScrollArea, QSizePolicy, QStatusBar,
+    QTableView, QVBoxLayout, QWidget)
 #import logo
 
 
@@ -59,6 +59,10 @@ class Ui_MainWindow(object):
         self.dur_table_view = QTableView(self.scrollAreaWidgetContents)
         self.dur_table_view.setObjectName(u"dur_table_view")
         self.dur_table_view.setGeometry(QRect(20, 40, 1321, 211))
+        self.dur_filter_edit = QLineEdit(self.scrollAreaWidgetContents)
+        self.dur_filter_edit.setObjectName(u"dur_filter_edit")
+        self.dur_filter_edit.setGeometry(QRect(1041, 5, 300, 28))
+        self.dur_filter_edit.setClearButtonEnabled(True)
         self.dur_data_scroll_area.setWidget(self.scrollAreaWidgetContents)
         self.verticalLayoutWidget = QWidget(self.centralwidget)
         self.verticalLayoutWidget.setObjectName(u"verticalLayoutWidget")
@@ -126,6 +130,7 @@ class Ui_MainWindow(object):
         self.label_5.setText(QCoreApplication.translate("MainWindow", u"Ingredient", None))
         self.label_6.setText(QCoreApplication.translate("MainWindow", u"Side Effects", None))
         self.label_7.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.dur_filter_edit.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Filter DUR results", None))
         self.ocr_result_label.setText(QCoreApplication.translate("MainWindow", u"Pill name will be displayed here.", None))
         self.label.setText(QCoreApplication.translate("MainWindow", u"Current Text", None))
         self.label_2.setText(QCoreApplication.translate("MainWindow", u"Camera View", None))